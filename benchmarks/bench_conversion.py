@@ -0,0 +1,54 @@
+"""
+Benchmark _convert_to_dataframe against the former row-dict implementation.
+
+Usage:
+    python benchmarks/bench_conversion.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from _synthetic import DEFAULT_DIMENSIONS, DEFAULT_METRICS, make_response
+from ga4_app import GA4AnalyticsClient
+
+
+def convert_row_dicts(all_data, dimensions, metrics) -> pd.DataFrame:
+    """Previous implementation: one dict per row, then pd.DataFrame(list_of_dicts)."""
+    data = []
+    for row in all_data:
+        row_dict = {}
+        for i, dimension in enumerate(dimensions):
+            row_dict[dimension] = row.dimension_values[i].value
+        for i, metric in enumerate(metrics):
+            row_dict[metric] = row.metric_values[i].value
+        data.append(row_dict)
+    return pd.DataFrame(data)
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Building synthetic response with {args.rows} rows...")
+    rows = make_response(args.rows).rows
+    client = GA4AnalyticsClient(credentials_path="unused", property_id="0")
+
+    legacy = timed(convert_row_dicts, rows, DEFAULT_DIMENSIONS, DEFAULT_METRICS)
+    columnar = timed(client._convert_to_dataframe, rows, DEFAULT_DIMENSIONS, DEFAULT_METRICS)
+
+    print(f"row dicts: {legacy:8.2f}s  ({args.rows / legacy:,.0f} rows/s)")
+    print(f"columnar:  {columnar:8.2f}s  ({args.rows / columnar:,.0f} rows/s)")
+    print(f"speedup:   {legacy / columnar:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
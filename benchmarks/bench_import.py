@@ -0,0 +1,70 @@
+"""
+Guard the import time of ga4_app.
+
+Imports ga4_app in a fresh interpreter, reports the time taken and fails if
+it exceeds the budget or if any heavy dependency is imported eagerly.
+
+Usage:
+    python benchmarks/bench_import.py --budget-ms 150
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported on first use
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "grpc", "google.protobuf", "google.analytics", "dotenv"]
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import ga4_app
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{
+    "elapsed_ms": elapsed_ms,
+    "eager_modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+}}))
+"""
+
+
+def measure(runs: int) -> dict:
+    """Import ga4_app in `runs` fresh interpreters and keep the fastest run."""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(results, key=lambda result: result["elapsed_ms"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(f"import ga4_app: {result['elapsed_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if result["eager_modules"]:
+        print(f"FAIL: imported eagerly: {', '.join(result['eager_modules'])}")
+        failed = True
+    if result["elapsed_ms"] > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
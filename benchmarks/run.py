@@ -0,0 +1,267 @@
+"""
+Benchmark suite for pagination, conversion and export.
+
+Each case feeds synthetic protobuf responses of a given size and width
+through one stage of GA4AnalyticsClient and records throughput (rows/s),
+peak RSS growth and, with --trace-allocations, the peak of Python
+allocations. Every case runs in a fresh interpreter so peak RSS is not
+polluted by earlier cases.
+
+Stages:
+    conversion      _convert_to_dataframe over the rows of a full report
+    pagination      _run_paginated_request against pre-built pages
+    export_csv      export_report streaming pages to a CSV file
+    export_parquet  export_report streaming pages to a Parquet file
+
+Results can be saved as a baseline and later runs compared against it;
+the comparison exits with status 1 when a case regresses beyond the
+tolerance.
+
+Usage:
+    python benchmarks/run.py --sizes 10k,1m --save-baseline
+    python benchmarks/run.py --sizes 10k,1m --compare --tolerance 0.15
+    python benchmarks/run.py --stages conversion --widths wide --sizes 5m --trace-allocations
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _synthetic import make_response
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "baseline.json"
+
+STAGES = ["conversion", "pagination", "export_csv", "export_parquet"]
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "5m": 5_000_000}
+
+WIDTHS = {
+    "narrow": (["deviceCategory"], ["sessions"]),
+    "default": (["deviceCategory", "country", "sessionSource"], ["sessions", "totalUsers"]),
+    "wide": (
+        ["deviceCategory", "country", "city", "sessionSource", "sessionMedium",
+         "browser", "operatingSystem", "landingPage"],
+        ["sessions", "totalUsers", "newUsers", "screenPageViews", "eventCount", "conversions"]
+    )
+}
+
+
+class _ReplayClient:
+    """Stands in for BetaAnalyticsDataClient by returning pre-built pages by offset."""
+
+    def __init__(self, pages: Dict[int, Any]):
+        self.pages = pages
+
+    def run_report(self, request):
+        return self.pages[request.offset]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _build_pages(n_rows: int, dimensions: List[str], metrics: List[str], page_size: int) -> Dict[int, Any]:
+    from google.analytics.data_v1beta.types import MetricType
+
+    pages = {}
+    for offset in range(0, n_rows, page_size):
+        page = make_response(
+            min(page_size, n_rows - offset), dimensions, metrics,
+            seed=offset, metric_type=MetricType.TYPE_INTEGER
+        )
+        page.row_count = n_rows
+        pages[offset] = page
+    return pages
+
+
+def run_case(stage: str, size: str, width: str, trace_allocations: bool) -> Dict[str, Any]:
+    """
+    Run a single benchmark case in the current interpreter.
+
+    Args:
+        stage: One of STAGES
+        size: Key of SIZES
+        width: Key of WIDTHS
+
+    Returns:
+        Dictionary with rows, seconds, rows_per_s, peak_rss_mb and, when
+        allocations are traced, alloc_peak_mb
+    """
+    from ga4_app import GA4AnalyticsClient
+
+    n_rows = SIZES[size]
+    dimensions, metrics = WIDTHS[width]
+
+    client = GA4AnalyticsClient(credentials_path="unused", property_id="0")
+    pages = _build_pages(n_rows, dimensions, metrics, client.MAX_ROWS_PER_REQUEST)
+    client._client = _ReplayClient(pages)
+
+    if stage == "conversion":
+        rows = [row for offset in sorted(pages) for row in pages[offset].rows]
+        metric_types = client._get_metric_types(pages[0])
+        run = lambda: client._convert_to_dataframe(rows, dimensions, metrics, metric_types)
+    elif stage == "pagination":
+        run = lambda: client._run_paginated_request("2025-01-01", "2025-01-31", dimensions, metrics)
+    elif stage in ("export_csv", "export_parquet"):
+        output_dir = tempfile.TemporaryDirectory()
+        extension = "csv" if stage == "export_csv" else "parquet"
+        output_path = str(Path(output_dir.name) / f"report.{extension}")
+        run = lambda: client.export_report(
+            output_path, "2025-01-01", "2025-01-31", dimensions, metrics,
+            convert_date_columns=False
+        )
+    else:
+        raise ValueError(f"Unknown stage '{stage}', expected one of {STAGES}")
+
+    # ga4_app imports these on first use; load them now so the import is not measured
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    if stage == "export_parquet":
+        import pyarrow.parquet  # noqa: F401
+
+    rss_before = _peak_rss_mb()
+    if trace_allocations:
+        import tracemalloc
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    result = {
+        "rows": n_rows,
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds,
+        # Growth of the peak over what the synthetic fixture already uses
+        "peak_rss_mb": _peak_rss_mb() - rss_before
+    }
+    if trace_allocations:
+        result["alloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    return result
+
+
+def run_isolated(stage: str, size: str, width: str, trace_allocations: bool) -> Dict[str, Any]:
+    """Run a case in a fresh interpreter and return its result."""
+    command = [sys.executable, __file__, "--case", f"{stage}:{size}:{width}"]
+    if trace_allocations:
+        command.append("--trace-allocations")
+
+    output = subprocess.run(command, capture_output=True, text=True)
+    if output.returncode != 0:
+        raise RuntimeError(f"Case {stage}:{size}:{width} failed:\n{output.stderr}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Results keyed by case id
+        baseline: Saved baseline with a 'cases' mapping
+        tolerance: Allowed relative slowdown or memory growth, e.g. 0.1
+
+    Returns:
+        List of regression messages, empty when nothing regressed
+    """
+    regressions = []
+    for case_id, result in results.items():
+        reference = baseline["cases"].get(case_id)
+        if reference is None:
+            continue
+
+        throughput_change = result["rows_per_s"] / reference["rows_per_s"] - 1
+        line = f"{case_id:40s} rows/s {throughput_change:+7.1%}"
+        if throughput_change < -tolerance:
+            regressions.append(f"{case_id}: throughput {throughput_change:+.1%}")
+
+        # Ignore RSS noise on cases too small to move the peak meaningfully
+        rss_growth = result["peak_rss_mb"] - reference["peak_rss_mb"]
+        if reference["peak_rss_mb"] > 16:
+            line += f"  peak RSS {rss_growth / reference['peak_rss_mb']:+7.1%}"
+            if rss_growth > tolerance * reference["peak_rss_mb"]:
+                regressions.append(f"{case_id}: peak RSS {rss_growth:+.0f} MiB")
+
+        print(line)
+
+    return regressions
+
+
+def _parse_list(value: str, choices) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown value(s) {unknown}, expected {list(choices)}")
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--stages", type=lambda v: _parse_list(v, STAGES), default=STAGES)
+    parser.add_argument("--sizes", type=lambda v: _parse_list(v, SIZES), default=list(SIZES))
+    parser.add_argument("--widths", type=lambda v: _parse_list(v, WIDTHS), default=list(WIDTHS))
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="record the peak of Python allocations (slows the run down)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, type=Path)
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(*args.case.split(":"), args.trace_allocations)))
+        return
+
+    results = {}
+    for stage in args.stages:
+        if stage == "export_parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                print("Skipping export_parquet: pyarrow is not installed")
+                continue
+        for size in args.sizes:
+            for width in args.widths:
+                case_id = f"{stage}:{size}:{width}"
+                result = run_isolated(stage, size, width, args.trace_allocations)
+                results[case_id] = result
+
+                line = (f"{case_id:40s} {result['rows_per_s']:>12,.0f} rows/s "
+                        f"{result['peak_rss_mb']:>9,.0f} MiB peak RSS")
+                if "alloc_peak_mb" in result:
+                    line += f" {result['alloc_peak_mb']:>9,.0f} MiB allocated"
+                print(line)
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "cases": results
+        }
+        args.save_baseline.write_text(json.dumps(baseline, indent=2))
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nComparison against {args.compare} ({baseline['machine']}):")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
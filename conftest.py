@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.fixture
+def server(request):
+    """Run a FakeGA4Server; a test module can set ROW_COUNT to change the report size."""
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.analytics.data_v1beta")
+    from fake_ga4_server import FakeGA4Server
+
+    with FakeGA4Server(row_count=getattr(request.module, "ROW_COUNT", 10500)) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client(server):
+    """Return a factory of GA4AnalyticsClients talking to the fake server in 3000-row pages."""
+    from ga4_app import GA4AnalyticsClient
+
+    def make(fail_at_offset=None, **kwargs):
+        client = GA4AnalyticsClient(
+            credentials_path="unused",
+            property_id="0",
+            transport=server.create_transport(),
+            **kwargs
+        )
+        client.MAX_ROWS_PER_REQUEST = 3000
+
+        if fail_at_offset is not None:
+            fetch_page = client._fetch_page
+
+            def failing_fetch_page(request_kwargs, offset, *args):
+                if offset >= fail_at_offset:
+                    raise RuntimeError(f"API request failed at offset {offset}")
+                return fetch_page(request_kwargs, offset, *args)
+
+            client._fetch_page = failing_fetch_page
+        return client
+
+    return make
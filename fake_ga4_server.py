@@ -0,0 +1,325 @@
+"""
+Local fake of the GA4 Data API for offline benchmarking and load testing.
+
+FakeGA4Server serves the BetaAnalyticsData gRPC service on localhost and
+answers RunReport and BatchRunReports with deterministic synthetic pages,
+and GetMetadata and CheckCompatibility from a configurable set of names.
+Row counts, latency, error injection and property quota are configurable,
+and clients are pointed at it through the ``transport`` argument:
+
+    with FakeGA4Server(row_count=1_000_000, latency=0.05) as server:
+        client = GA4AnalyticsClient(property_id="0", transport=server.create_transport())
+        df = client.get_report("2025-06-01", "2025-06-30", ["date"], ["sessions"])
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent import futures
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import grpc
+from google.analytics.data_v1beta.services.beta_analytics_data.transports import (
+    BetaAnalyticsDataGrpcAsyncIOTransport,
+    BetaAnalyticsDataGrpcTransport
+)
+from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
+    BatchRunReportsResponse,
+    CheckCompatibilityRequest,
+    CheckCompatibilityResponse,
+    Compatibility,
+    GetMetadataRequest,
+    Metadata,
+    MetricType,
+    RunReportRequest,
+    RunReportResponse
+)
+
+from ga4_app import _resolve_date
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "google.analytics.data.v1beta.BetaAnalyticsData"
+DEFAULT_PAGE_SIZE = 10000
+
+DEFAULT_DIMENSIONS = [
+    "date", "deviceCategory", "country", "city", "sessionSource", "sessionMedium",
+    "browser", "operatingSystem", "landingPage", "pagePath", "eventName", "userGender"
+]
+DEFAULT_METRICS = [
+    "sessions", "totalUsers", "newUsers", "activeUsers", "screenPageViews", "eventCount",
+    "conversions", "totalRevenue", "averageSessionDuration", "engagementRate", "bounceRate"
+]
+
+
+class FakeGA4Server:
+    """
+    In-process gRPC stand-in for BetaAnalyticsDataService.
+
+    Every report has ``row_count`` rows. Row values depend only on the row
+    index and the seed, so the same request always returns the same page.
+    The 'date' dimension cycles through the requested date range and metric
+    types are guessed from metric names unless given in ``metric_types``.
+    """
+
+    def __init__(
+            self,
+            row_count: int = 10000,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+            cardinality: int = 50,
+            metric_types: Optional[Dict[str, MetricType]] = None,
+            tokens_per_request: int = 10,
+            tokens_per_hour: int = 40000,
+            tokens_per_day: int = 200000,
+            seed: int = 0,
+            max_workers: int = 16,
+            known_dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+            known_metrics: Sequence[str] = DEFAULT_METRICS,
+            incompatible: Sequence[Tuple[str, str]] = ()
+    ):
+        """
+        Initialize the fake server.
+
+        Args:
+            row_count: Total number of rows in every report
+            latency: Seconds each call sleeps before answering
+            error_rate: Probability that a call fails with error_code
+            error_code: gRPC status code of injected errors
+            cardinality: Number of distinct values per non-date dimension
+            metric_types: Optional metric type per metric name
+            tokens_per_request: Quota tokens consumed by each call
+            tokens_per_hour: Hourly token quota reported to clients
+            tokens_per_day: Daily token quota reported to clients
+            seed: Seed for row values and error injection
+            max_workers: Number of server threads
+            known_dimensions: Dimension names returned by GetMetadata
+            known_metrics: Metric names returned by GetMetadata
+            incompatible: (dimension, metric) pairs reported as incompatible
+                by CheckCompatibility when both are requested
+        """
+        self.row_count = row_count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.cardinality = cardinality
+        self.metric_types = metric_types or {}
+        self.tokens_per_request = tokens_per_request
+        self.tokens_per_hour = tokens_per_hour
+        self.tokens_per_day = tokens_per_day
+        self.seed = seed
+        self.known_dimensions = list(known_dimensions)
+        self.known_metrics = list(known_metrics)
+        self.incompatible = set(incompatible)
+        self.request_count = 0
+        self.tokens_consumed = 0
+        self.port: Optional[int] = None
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        self._server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(
+            SERVICE_NAME,
+            {
+                "RunReport": grpc.unary_unary_rpc_method_handler(
+                    self._run_report,
+                    request_deserializer=RunReportRequest.deserialize,
+                    response_serializer=lambda message: message.SerializeToString()
+                ),
+                "BatchRunReports": grpc.unary_unary_rpc_method_handler(
+                    self._batch_run_reports,
+                    request_deserializer=BatchRunReportsRequest.deserialize,
+                    response_serializer=lambda message: message.SerializeToString()
+                ),
+                "GetMetadata": grpc.unary_unary_rpc_method_handler(
+                    self._get_metadata,
+                    request_deserializer=GetMetadataRequest.deserialize,
+                    response_serializer=lambda message: message.SerializeToString()
+                ),
+                "CheckCompatibility": grpc.unary_unary_rpc_method_handler(
+                    self._check_compatibility,
+                    request_deserializer=CheckCompatibilityRequest.deserialize,
+                    response_serializer=lambda message: message.SerializeToString()
+                )
+            }
+        ),))
+
+    @property
+    def address(self) -> str:
+        return f"localhost:{self.port}"
+
+    def start(self) -> "FakeGA4Server":
+        self.port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+        logger.info(f"Fake GA4 server listening on {self.address}")
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        self._server.stop(grace)
+
+    def __enter__(self) -> "FakeGA4Server":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def create_transport(self) -> BetaAnalyticsDataGrpcTransport:
+        """Create a synchronous transport connected to this server."""
+        return BetaAnalyticsDataGrpcTransport(channel=grpc.insecure_channel(self.address))
+
+    def create_async_transport(self) -> BetaAnalyticsDataGrpcAsyncIOTransport:
+        """Create an asyncio transport connected to this server; call from within the event loop."""
+        return BetaAnalyticsDataGrpcAsyncIOTransport(channel=grpc.aio.insecure_channel(self.address))
+
+    def _simulate_call(self, context: grpc.ServicerContext, consumes_tokens: bool = True) -> int:
+        """
+        Apply latency, error injection and quota accounting to a call.
+
+        Args:
+            context: Context of the call
+            consumes_tokens: Whether the call counts against the property quota;
+                metadata and compatibility calls don't
+
+        Returns:
+            Tokens consumed so far, including this call
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.request_count += 1
+            failed = self._random.random() < self.error_rate
+            if not failed and consumes_tokens:
+                self.tokens_consumed += self.tokens_per_request
+            tokens_consumed = self.tokens_consumed
+
+        if failed:
+            context.abort(self.error_code, "Injected error")
+        if tokens_consumed > self.tokens_per_day:
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Exhausted property tokens per day")
+
+        return tokens_consumed
+
+    def _run_report(self, request: RunReportRequest, context: grpc.ServicerContext):
+        tokens_consumed = self._simulate_call(context)
+        return self._build_response(request, tokens_consumed)
+
+    def _batch_run_reports(self, request: BatchRunReportsRequest, context: grpc.ServicerContext):
+        tokens_consumed = self._simulate_call(context)
+        response = BatchRunReportsResponse.pb()()
+        for report_request in request.requests:
+            response.reports.add().CopyFrom(self._build_response(report_request, tokens_consumed))
+        return response
+
+    def _get_metadata(self, request: GetMetadataRequest, context: grpc.ServicerContext):
+        self._simulate_call(context, consumes_tokens=False)
+        metadata = Metadata.pb()()
+        metadata.name = request.name
+        for dimension in self.known_dimensions:
+            metadata.dimensions.add(api_name=dimension)
+        for metric in self.known_metrics:
+            metadata.metrics.add(api_name=metric)
+        return metadata
+
+    def _check_compatibility(self, request: CheckCompatibilityRequest, context: grpc.ServicerContext):
+        self._simulate_call(context, consumes_tokens=False)
+        dimensions = [dimension.name for dimension in request.dimensions]
+        metrics = [metric.name for metric in request.metrics]
+        incompatible_dimensions = {d for d, m in self.incompatible if d in dimensions and m in metrics}
+        incompatible_metrics = {m for d, m in self.incompatible if d in dimensions and m in metrics}
+        wanted = request.compatibility_filter
+
+        response = CheckCompatibilityResponse.pb()()
+        for dimension in dimensions:
+            compatibility = (
+                Compatibility.INCOMPATIBLE if dimension in incompatible_dimensions else Compatibility.COMPATIBLE
+            )
+            if not wanted or compatibility == wanted:
+                item = response.dimension_compatibilities.add(compatibility=compatibility)
+                item.dimension_metadata.api_name = dimension
+        for metric in metrics:
+            compatibility = (
+                Compatibility.INCOMPATIBLE if metric in incompatible_metrics else Compatibility.COMPATIBLE
+            )
+            if not wanted or compatibility == wanted:
+                item = response.metric_compatibilities.add(compatibility=compatibility)
+                item.metric_metadata.api_name = metric
+        return response
+
+    def _metric_type(self, name: str) -> MetricType:
+        if name in self.metric_types:
+            return self.metric_types[name]
+        if 'Duration' in name:
+            return MetricType.TYPE_SECONDS
+        if 'revenue' in name.lower():
+            return MetricType.TYPE_CURRENCY
+        if 'average' in name or 'Rate' in name or 'PerUser' in name:
+            return MetricType.TYPE_FLOAT
+        return MetricType.TYPE_INTEGER
+
+    def _dates(self, request: RunReportRequest) -> List[str]:
+        if not request.date_ranges:
+            return [date.today().strftime('%Y%m%d')]
+        start = _resolve_date(request.date_ranges[0].start_date)
+        end = _resolve_date(request.date_ranges[0].end_date)
+        return [
+            (start + timedelta(days=i)).strftime('%Y%m%d')
+            for i in range(max((end - start).days + 1, 1))
+        ]
+
+    def _build_response(self, request: RunReportRequest, tokens_consumed: int):
+        """
+        Build one page of a synthetic report as a raw protobuf message.
+
+        Raw protobuf is used instead of proto-plus because it is much faster
+        to populate for pages of hundreds of thousands of rows.
+        """
+        response = RunReportResponse.pb()()
+        response.row_count = self.row_count
+
+        dimensions = [dimension.name for dimension in request.dimensions]
+        metrics = [metric.name for metric in request.metrics]
+        metric_types = [self._metric_type(metric) for metric in metrics]
+        dates = self._dates(request) if 'date' in dimensions else []
+
+        for dimension in dimensions:
+            response.dimension_headers.add(name=dimension)
+        for metric, metric_type in zip(metrics, metric_types):
+            header = response.metric_headers.add(name=metric)
+            header.type_ = metric_type
+
+        limit = request.limit or DEFAULT_PAGE_SIZE
+        first_row = min(request.offset, self.row_count)
+        last_row = min(request.offset + limit, self.row_count)
+
+        for index in range(first_row, last_row):
+            row = response.rows.add()
+            mixed = (index + 1) * 2654435761 + self.seed
+            for position, dimension in enumerate(dimensions):
+                if dimension == 'date':
+                    value = dates[index % len(dates)]
+                else:
+                    value = f"{dimension}_{(mixed >> position) % self.cardinality}"
+                row.dimension_values.add(value=value)
+            for position, metric_type in enumerate(metric_types):
+                number = (mixed >> (position + 7)) % 100000
+                if metric_type == MetricType.TYPE_INTEGER:
+                    row.metric_values.add(value=str(number))
+                else:
+                    row.metric_values.add(value=f"{number / 100:.2f}")
+
+        if request.return_property_quota:
+            quota = response.property_quota
+            quota.tokens_per_day.consumed = self.tokens_per_request
+            quota.tokens_per_day.remaining = max(self.tokens_per_day - tokens_consumed, 0)
+            quota.tokens_per_hour.consumed = self.tokens_per_request
+            quota.tokens_per_hour.remaining = max(self.tokens_per_hour - tokens_consumed, 0)
+            quota.tokens_per_project_per_hour.consumed = self.tokens_per_request
+            quota.tokens_per_project_per_hour.remaining = max(self.tokens_per_hour - tokens_consumed, 0)
+            quota.concurrent_requests.remaining = 10
+
+        return response
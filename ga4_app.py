@@ -1,290 +1,3367 @@
+from __future__ import annotations
+
 import os
+import re
+import atexit
+import contextvars
+import asyncio
+import json
+import time
+import random
+import heapq
+import hashlib
 import logging
-import pandas as pd
-from datetime import datetime
-from dotenv import load_dotenv
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from google.oauth2 import service_account
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.analytics.data_v1beta.types import (
-    Filter,
-    FilterExpression,
-    FilterExpressionList,
-    OrderBy,
-    RunReportRequest
+from urllib.parse import quote
+from typing import (
+    TYPE_CHECKING, List, Dict, Optional, Any, AsyncIterator, Awaitable, Callable, Iterator, Sequence,
+    Tuple, Union
+)
+
+# pandas, numpy and the google client libraries are imported on first use so
+# that importing this module stays cheap for short-lived processes
+if TYPE_CHECKING:
+    import pandas as pd
+    from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient, BetaAnalyticsDataClient
+    from google.analytics.data_v1beta.types import (
+        FilterExpression,
+        MetricType,
+        RunReportRequest,
+        RunReportResponse
+    )
+
+logger = logging.getLogger(__name__)
+
+# Names of metric types parsed into int64 and float64 columns during conversion
+INTEGER_METRIC_TYPES = frozenset({'TYPE_INTEGER'})
+FLOAT_METRIC_TYPES = frozenset({
+    'TYPE_FLOAT',
+    'TYPE_SECONDS',
+    'TYPE_MILLISECONDS',
+    'TYPE_MINUTES',
+    'TYPE_HOURS',
+    'TYPE_STANDARD',
+    'TYPE_CURRENCY',
+    'TYPE_FEET',
+    'TYPE_MILES',
+    'TYPE_METERS',
+    'TYPE_KILOMETERS'
+})
+
+_environment_loaded = False
+
+
+def _load_environment() -> None:
+    """Load variables from a .env file into the environment, once per process."""
+    global _environment_loaded
+
+    if not _environment_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _environment_loaded = True
+
+
+# gRPC channel options used by pooled connections
+DEFAULT_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.max_receive_message_length", -1)
 )
 
-# Load environment variables
-load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+class ChannelPool:
+    """
+    Process-wide pool of authenticated GA4 API clients.
+
+    Clients are keyed by credentials path and channel options, so every
+    GA4AnalyticsClient using the same service account reuses one gRPC channel
+    and one set of credentials instead of paying a TLS handshake and token
+    refresh per instance. Pooled channels are closed at interpreter exit.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], BetaAnalyticsDataClient] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+            self,
+            credentials_path: str,
+            channel_options: Sequence[Tuple[str, Any]] = DEFAULT_CHANNEL_OPTIONS
+    ) -> BetaAnalyticsDataClient:
+        """
+        Get the pooled client for a service account, creating it on first use.
+
+        Args:
+            credentials_path: Path to service account credentials JSON file
+            channel_options: gRPC channel options, e.g. keepalive and message size
+
+        Returns:
+            BetaAnalyticsDataClient: Authenticated client sharing a pooled channel
+        """
+        from google.analytics.data_v1beta import BetaAnalyticsDataClient
+        from google.analytics.data_v1beta.services.beta_analytics_data.transports import (
+            BetaAnalyticsDataGrpcTransport
+        )
+        from google.oauth2 import service_account
+
+        key = (credentials_path, tuple(channel_options))
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                credentials = service_account.Credentials.from_service_account_file(credentials_path)
+                channel = BetaAnalyticsDataGrpcTransport.create_channel(
+                    credentials=credentials,
+                    options=list(channel_options)
+                )
+                client = BetaAnalyticsDataClient(
+                    transport=BetaAnalyticsDataGrpcTransport(channel=channel)
+                )
+                self._clients[key] = client
+                logger.info(f"Opened pooled GA4 API channel for {credentials_path}")
+            return client
+
+    def close(self) -> None:
+        """Close all pooled channels."""
+        with self._lock:
+            for client in self._clients.values():
+                client.transport.close()
+            self._clients.clear()
+
+
+channel_pool = ChannelPool()
+atexit.register(channel_pool.close)
+
+
+class MetadataCache:
+    """
+    Process-wide cache of property metadata and compatibility answers.
+
+    Dimension and metric names are kept per property, and incompatible
+    names per distinct (property, dimensions, metrics) spec, so that
+    request validation costs at most one API call of each kind per spec.
+    Entries expire after ``ttl`` seconds to pick up new custom definitions.
+    """
+
+    DEFAULT_TTL = 24 * 3600
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._names: Dict[str, Tuple[float, Tuple[frozenset, frozenset]]] = {}
+        self._incompatible: Dict[Tuple, Tuple[float, Tuple[List[str], List[str]]]] = {}
+
+    def _get(self, entries: Dict, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                return None
+            return entry[1]
+
+    def get_names(self, property_id: str) -> Optional[Tuple[frozenset, frozenset]]:
+        """Return the cached (dimension names, metric names) of a property, if any."""
+        return self._get(self._names, property_id)
+
+    def put_names(self, property_id: str, names: Tuple[frozenset, frozenset]) -> None:
+        with self._lock:
+            self._names[property_id] = (time.monotonic(), names)
+
+    def get_incompatible(self, key: Tuple) -> Optional[Tuple[List[str], List[str]]]:
+        """Return the cached (incompatible dimensions, incompatible metrics) of a spec, if any."""
+        return self._get(self._incompatible, key)
+
+    def put_incompatible(self, key: Tuple, incompatible: Tuple[List[str], List[str]]) -> None:
+        with self._lock:
+            self._incompatible[key] = (time.monotonic(), incompatible)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+            self._incompatible.clear()
+
+
+metadata_cache = MetadataCache()
+
+
+class _NoopSpan:
+    """Stand-in for an OpenTelemetry span when opentelemetry is not installed."""
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_tracer: Any = None
+
+
+def _start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Start an OpenTelemetry span as the current span, or a no-op span when
+    opentelemetry is not installed.
+
+    Args:
+        name: Span name
+        attributes: Initial span attributes; None values are dropped
+
+    Returns:
+        Context manager yielding the span
+    """
+    global _tracer
+    if _tracer is None:
+        try:
+            from opentelemetry import trace
+            _tracer = trace.get_tracer(__name__)
+        except ImportError:
+            _tracer = False
+
+    if _tracer is False:
+        return _NoopSpan()
+
+    attributes = {key: value for key, value in (attributes or {}).items() if value is not None}
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _submit_in_context(executor: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Submit a call to an executor in a copy of the caller's context, so the
+    active trace span is the parent of spans started in the worker thread.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+class _RequestCounter:
+    """Thread-safe counter of API requests issued for a single report."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+class _RetryBudget:
+    """Thread-safe number of retries left for a single report."""
+
+    def __init__(self, retries: int):
+        self._lock = threading.Lock()
+        self.remaining = retries
+
+    def try_consume(self) -> bool:
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient API errors.
+
+    Errors are sorted into retryable (unavailable, deadline exceeded,
+    internal, aborted, rate limited, connection errors) and fatal (everything
+    else, e.g. invalid argument or permission denied). GA4 reports every
+    exhausted quota as ResourceExhausted; only the concurrent-request and
+    hourly quotas are retried, since a spent daily quota won't recover
+    within any backoff and is left to QuotaTracker. A failed page is
+    retried up to ``max_attempts`` times, and all pages of a report share a
+    budget of ``retry_budget`` retries so a persistently failing report
+    gives up instead of retrying every page to the limit.
+    """
+
+    # Markers of the ResourceExhausted messages that clear up within a backoff
+    RETRYABLE_QUOTA_MESSAGES = ('concurrent', 'per hour')
+
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            initial_delay: float = 1.0,
+            max_delay: float = 60.0,
+            multiplier: float = 2.0,
+            retry_budget: int = 20
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Maximum attempts per request, including the first one
+            initial_delay: Upper bound of the first backoff delay in seconds
+            max_delay: Upper bound of any backoff delay in seconds
+            multiplier: Growth factor of the delay bound per attempt
+            retry_budget: Maximum retries across all pages of one report
+        """
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.retry_budget = retry_budget
+
+    def new_budget(self) -> _RetryBudget:
+        return _RetryBudget(self.retry_budget)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Decide whether an error is transient.
+
+        Args:
+            error: Exception raised by an API call
+
+        Returns:
+            True if the error may go away when the call is retried
+        """
+        from google.api_core import exceptions as api_exceptions
+
+        # ResourceExhausted subclasses TooManyRequests, so it's checked first
+        if isinstance(error, api_exceptions.ResourceExhausted):
+            message = str(error).lower()
+            return any(marker in message for marker in self.RETRYABLE_QUOTA_MESSAGES)
+
+        return isinstance(error, (
+            api_exceptions.ServiceUnavailable,
+            api_exceptions.DeadlineExceeded,
+            api_exceptions.InternalServerError,
+            api_exceptions.Aborted,
+            api_exceptions.TooManyRequests,
+            ConnectionError
+        ))
+
+    def should_retry(self, error: Exception, attempt: int, budget: Optional[_RetryBudget] = None) -> bool:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based number of the failed attempt
+            budget: Retry budget of the current report
+
+        Returns:
+            True if the request should be retried
+        """
+        if not self.is_retryable(error) or attempt + 1 >= self.max_attempts:
+            return False
+        return budget is None or budget.try_consume()
+
+    def delay(self, attempt: int) -> float:
+        """
+        Compute the backoff delay before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Delay in seconds, drawn uniformly up to the exponential bound
+        """
+        return random.uniform(0, min(self.max_delay, self.initial_delay * self.multiplier ** attempt))
+
+
+def _resolve_date(value: str, today: Optional[date] = None) -> date:
+    """
+    Resolve a GA4 date string to a calendar date.
+
+    Args:
+        value: Date in YYYY-MM-DD format, 'today', 'yesterday' or 'NdaysAgo'
+        today: Reference date for relative values, defaults to today
+
+    Returns:
+        Resolved date
+    """
+    today = today or date.today()
+
+    if value == 'today':
+        return today
+    if value == 'yesterday':
+        return today - timedelta(days=1)
+
+    match = re.fullmatch(r'(\d+)daysAgo', value)
+    if match:
+        return today - timedelta(days=int(match.group(1)))
+
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _contiguous_ranges(days: List[date]) -> List[Tuple[date, date]]:
+    """
+    Group sorted days into contiguous (start, end) ranges.
+
+    Args:
+        days: Sorted list of dates
+
+    Returns:
+        List of inclusive (start, end) date tuples
+    """
+    ranges = []
+    for day in days:
+        if ranges and day - ranges[-1][1] == timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of RunReportResponse pages.
+
+    Entries are content-addressed by a SHA-256 hash of the serialized
+    RunReportRequest with relative dates resolved, so identical requests
+    issued by different jobs on the same host share cached pages, and a
+    'yesterday' page is never served for another day. Requests touching days
+    still inside GA4's data-freshness window expire after ``relative_ttl``;
+    closed date ranges expire after ``absolute_ttl`` (None keeps them
+    forever). When the cache grows beyond ``max_bytes`` the least recently
+    used entries are evicted until it is back under EVICTION_TARGET_RATIO of
+    the limit; the total size is tracked incrementally between evictions.
+    """
+
+    DEFAULT_RELATIVE_TTL = 60 * 60
+    DEFAULT_ABSOLUTE_TTL = 30 * 24 * 60 * 60
+    DEFAULT_MAX_BYTES = 1024 ** 3
+    DEFAULT_FRESHNESS_DAYS = 3
+    EVICTION_TARGET_RATIO = 0.9
+
+    def __init__(
+            self,
+            cache_dir: str,
+            relative_ttl: float = DEFAULT_RELATIVE_TTL,
+            absolute_ttl: Optional[float] = DEFAULT_ABSOLUTE_TTL,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+            freshness_days: int = DEFAULT_FRESHNESS_DAYS
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored
+            relative_ttl: Seconds to keep responses for relative or recent date ranges
+            absolute_ttl: Seconds to keep responses for closed date ranges, None for no expiry
+            max_bytes: Maximum total size of the cache directory
+            freshness_days: Days before today for which GA4 data may still change
+        """
+        self.cache_dir = Path(cache_dir)
+        self.relative_ttl = relative_ttl
+        self.absolute_ttl = absolute_ttl
+        self.max_bytes = max_bytes
+        self.freshness_days = freshness_days
+        self._lock = threading.Lock()
+        # Total size of the entries, counted on the first write
+        self._total_bytes: Optional[int] = None
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(request: RunReportRequest) -> str:
+        """
+        Compute a stable fingerprint of a request.
+
+        Relative dates such as 'yesterday' are resolved first, so the
+        fingerprint identifies the days the request actually covers.
+
+        Args:
+            request: RunReportRequest to fingerprint
+
+        Returns:
+            Hex-encoded SHA-256 digest of the serialized request
+        """
+        from google.analytics.data_v1beta.types import RunReportRequest
+
+        resolved = RunReportRequest.deserialize(RunReportRequest.serialize(request))
+        for date_range in resolved.date_ranges:
+            date_range.start_date = _resolve_date(date_range.start_date).isoformat()
+            date_range.end_date = _resolve_date(date_range.end_date).isoformat()
+
+        return hashlib.sha256(RunReportRequest.serialize(resolved)).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pb"
+
+    def _ttl(self, request: RunReportRequest) -> Optional[float]:
+        """
+        Pick the TTL for a request based on its date ranges.
+
+        Args:
+            request: RunReportRequest being looked up
+
+        Returns:
+            TTL in seconds, or None if the entry never expires
+        """
+        freshness_cutoff = date.today() - timedelta(days=self.freshness_days)
+
+        for date_range in request.date_ranges:
+            if _resolve_date(date_range.end_date) >= freshness_cutoff:
+                return self.relative_ttl
+
+        return self.absolute_ttl
+
+    def get(self, request: RunReportRequest) -> Optional[RunReportResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            request: RunReportRequest to look up
+
+        Returns:
+            Cached RunReportResponse, or None on a miss or expired entry
+        """
+        from google.analytics.data_v1beta.types import RunReportResponse
+
+        path = self._path(self.fingerprint(request))
+
+        try:
+            stat = path.stat()
+            written_at = stat.st_mtime
+            ttl = self._ttl(request)
+            if ttl is not None and time.time() - written_at > ttl:
+                path.unlink(missing_ok=True)
+                self._track(-stat.st_size)
+                return None
+
+            response = RunReportResponse.deserialize(path.read_bytes())
+            # Record the access time for LRU eviction, keeping mtime as the write time
+            os.utime(path, (time.time(), written_at))
+            return response
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def put(self, request: RunReportRequest, response: RunReportResponse) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            request: RunReportRequest that produced the response
+            response: RunReportResponse to store
+        """
+        from google.analytics.data_v1beta.types import RunReportResponse
+
+        path = self._path(self.fingerprint(request))
+        data = RunReportResponse.serialize(response)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced_bytes = path.stat().st_size
+            except FileNotFoundError:
+                replaced_bytes = 0
+            # Write to a temporary file first so readers never see partial entries
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False) as tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            return
+
+        self._track(len(data) - replaced_bytes)
+
+    def _track(self, delta_bytes: int) -> None:
+        """Update the tracked cache size and evict entries once it exceeds max_bytes."""
+        with self._lock:
+            if self._total_bytes is None:
+                # The first scan already counts the entry that was just written
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += delta_bytes
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        """List (access time, size, path) of every cache entry."""
+        entries = []
+        for path in self.cache_dir.glob('*/*.pb'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is back under its eviction target."""
+        entries = self._scan()
+        # Rescan rather than trust the tracked size, other processes may share the directory
+        total_bytes = sum(size for _, size, _ in entries)
+        target_bytes = self.max_bytes * self.EVICTION_TARGET_RATIO
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= target_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+        self._total_bytes = total_bytes
+        logger.info(f"Evicted cache entries, cache size is now {total_bytes} bytes")
+
+
+class _PageCheckpoint:
+    """
+    Staging directory of fetched pages for a resumable report.
+
+    Each fetched page is stored as a serialized RunReportResponse next to a
+    manifest of completed offsets. The directory is named after the request
+    fingerprint, so re-running the same report picks up where it stopped.
+    Staged pages older than ``max_age`` are discarded rather than resumed,
+    since GA4 keeps revising recent data.
+    """
+
+    DEFAULT_MAX_AGE = timedelta(days=1)
+
+    def __init__(self, checkpoint_dir: str, fingerprint: str, max_age: timedelta = DEFAULT_MAX_AGE):
+        """
+        Open or create the staging directory of a report.
+
+        Args:
+            checkpoint_dir: Directory holding the staging directories
+            fingerprint: Fingerprint of the report's first page request
+            max_age: Maximum age of a staging directory that is still resumed
+        """
+        self.directory = Path(checkpoint_dir) / fingerprint
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.directory / 'manifest.json'
+        self._lock = threading.Lock()
+        self.completed_offsets = set()
+        self.created = datetime.now()
+
+        if self._manifest_path.exists():
+            manifest = json.loads(self._manifest_path.read_text())
+            created = datetime.fromisoformat(manifest['created']) if 'created' in manifest else None
+            if created is None or datetime.now() - created > max_age:
+                logger.warning(f"Discarding stale checkpoint {self.directory} created {created}")
+                self.clear()
+                self.directory.mkdir(parents=True, exist_ok=True)
+            else:
+                self.completed_offsets = set(manifest['completed_offsets'])
+                self.created = created
+                logger.info(
+                    f"Resuming from checkpoint {self.directory} "
+                    f"with {len(self.completed_offsets)} completed page(s)"
+                )
+
+    def _page_path(self, offset: int) -> Path:
+        return self.directory / f"page-{offset:012d}.pb"
+
+    def load(self, offset: int) -> Optional[RunReportResponse]:
+        """
+        Load a completed page.
+
+        Args:
+            offset: Starting row offset of the page
+
+        Returns:
+            Stored RunReportResponse, or None if the page isn't completed
+        """
+        from google.analytics.data_v1beta.types import RunReportResponse
+
+        if offset not in self.completed_offsets:
+            return None
+        return RunReportResponse.deserialize(self._page_path(offset).read_bytes())
+
+    def save(self, offset: int, response: RunReportResponse) -> None:
+        """
+        Store a fetched page and mark it completed in the manifest.
+
+        Args:
+            offset: Starting row offset of the page
+            response: RunReportResponse of the page
+        """
+        from google.analytics.data_v1beta.types import RunReportResponse
+
+        page_path = self._page_path(offset)
+        tmp_path = page_path.with_suffix('.tmp')
+        tmp_path.write_bytes(RunReportResponse.serialize(response))
+        os.replace(tmp_path, page_path)
+
+        with self._lock:
+            self.completed_offsets.add(offset)
+            tmp_manifest = self._manifest_path.with_suffix('.tmp')
+            tmp_manifest.write_text(json.dumps({
+                "created": self.created.isoformat(),
+                "completed_offsets": sorted(self.completed_offsets)
+            }))
+            os.replace(tmp_manifest, self._manifest_path)
+
+    def clear(self) -> None:
+        """Remove the staging directory once the report has been written."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _split_date_range(start: date, end: date, shard_by: str) -> List[Tuple[date, date]]:
+    """
+    Split an inclusive date range into day, week or month shards.
+
+    Weeks run Monday to Sunday and months follow the calendar; the first and
+    last shards are clipped to the range.
+
+    Args:
+        start: First day of the range
+        end: Last day of the range
+        shard_by: 'day', 'week' or 'month'
+
+    Returns:
+        List of inclusive (start, end) date tuples in chronological order
+    """
+    if shard_by not in ('day', 'week', 'month'):
+        raise ValueError(f"shard_by must be 'day', 'week', 'month' or 'auto', got '{shard_by}'")
+
+    shards = []
+    shard_start = start
+    while shard_start <= end:
+        if shard_by == 'day':
+            shard_end = shard_start
+        elif shard_by == 'week':
+            shard_end = shard_start + timedelta(days=6 - shard_start.weekday())
+        else:
+            next_month = (shard_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+            shard_end = next_month - timedelta(days=1)
+
+        shard_end = min(shard_end, end)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + timedelta(days=1)
+
+    return shards
+
+
+def _staging_path(output_path: str) -> Path:
+    """Return a unique temporary path next to output_path for an atomic write."""
+    path = Path(output_path)
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+class _CsvPageWriter:
+    """
+    Appends report pages to a CSV file, writing the header once.
+
+    Pages go to a temporary file that replaces output_path only when the
+    export completes, so a failed export leaves any existing file untouched.
+    """
+
+    def __init__(self, output_path: str):
+        self._output_path = output_path
+        self._tmp_path = _staging_path(output_path)
+        self._file = open(self._tmp_path, 'w', newline='', encoding='utf-8')
+        self._write_header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._file, header=self._write_header, index=False)
+        self._write_header = False
+
+    def close(self, completed: bool = True) -> None:
+        self._file.close()
+        if completed:
+            os.replace(self._tmp_path, self._output_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class _ParquetPageWriter:
+    """
+    Writes report pages to a Parquet file, one row group per page.
+
+    Column types follow each column's role rather than the pandas dtype of a
+    page: datetime columns, including categoricals with datetime categories,
+    become timestamps, other dimensions dictionary-encoded strings, and
+    metric columns keep the numeric types produced during conversion. The
+    schema is taken from the first page; later pages are cast to it. The
+    file is written under a temporary name and only renamed to output_path
+    when the export completes.
+    """
+
+    def __init__(self, output_path: str, dimensions: List[str], compression: str = 'zstd'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+
+        self._pa = pa
+        self._pq = pq
+        self._output_path = output_path
+        self._tmp_path = _staging_path(output_path)
+        self._dimensions = set(dimensions)
+        self._compression = compression
+        self._writer = None
+        self._schema = None
+
+    def _to_arrow_column(self, name: str, series: pd.Series) -> Any:
+        import numpy as np
+        import pandas as pd
+
+        pa = self._pa
+        is_categorical = isinstance(series.dtype, pd.CategoricalDtype)
+
+        if is_categorical and pd.api.types.is_datetime64_any_dtype(series.cat.categories):
+            series = series.astype(series.cat.categories.dtype)
+            is_categorical = False
+
+        if name not in self._dimensions or pd.api.types.is_datetime64_any_dtype(series):
+            return pa.array(series)
+
+        if is_categorical:
+            codes = series.cat.codes.to_numpy()
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes.astype(np.int32), mask=codes < 0),
+                pa.array(series.cat.categories.astype(str).tolist(), type=pa.string())
+            )
+
+        return pa.array(series, type=pa.string()).dictionary_encode()
+
+    def write(self, df: pd.DataFrame) -> None:
+        table = self._pa.Table.from_arrays(
+            [self._to_arrow_column(name, df[name]) for name in df.columns],
+            names=list(df.columns)
+        )
+
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._pq.ParquetWriter(
+                str(self._tmp_path), self._schema, compression=self._compression
+            )
+        elif table.schema != self._schema:
+            table = table.cast(self._schema)
+
+        self._writer.write_table(table, row_group_size=max(len(table), 1))
+
+    def close(self, completed: bool = True) -> None:
+        if self._writer is None:
+            return
+
+        self._writer.close()
+        if completed:
+            os.replace(self._tmp_path, self._output_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class _PartitionedPageWriter:
+    """
+    Writes report pages as a Hive-style partitioned dataset.
+
+    Each page is split by the partition column into
+    ``<column>=<value>/part-<run>-<n>.<ext>`` files, each written to a
+    temporary name and renamed into place. When the export finishes, files
+    left by earlier runs in the partitions touched by this run are removed,
+    so re-exporting a single day only rewrites that day's files. When it
+    fails, this run's files are removed instead and earlier runs are kept.
+    """
+
+    def __init__(
+            self,
+            output_dir: str,
+            partition_by: str,
+            file_format: str,
+            dimensions: List[str],
+            compression: str = 'zstd'
+    ):
+        self._output_dir = Path(output_dir)
+        self._partition_by = partition_by
+        self._file_format = file_format
+        self._dimensions = [dimension for dimension in dimensions if dimension != partition_by]
+        self._compression = compression
+        self._run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._sequence = 0
+        self._touched_partitions = set()
+
+    def _partition_value(self, value: Any) -> str:
+        import pandas as pd
+
+        if isinstance(value, (pd.Timestamp, datetime)):
+            return value.strftime('%Y-%m-%d')
+        if self._partition_by == 'date' and re.fullmatch(r'\d{8}', str(value)):
+            return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+        return quote(str(value), safe='')
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self._partition_by not in df.columns:
+            raise ValueError(f"Partition column '{self._partition_by}' is not in the report")
+
+        for value, group in df.groupby(self._partition_by, sort=False, observed=True):
+            partition_dir = self._output_dir / f"{self._partition_by}={self._partition_value(value)}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            self._touched_partitions.add(partition_dir)
+
+            file_name = f"part-{self._run_id}-{self._sequence:05d}.{self._file_format}"
+            self._sequence += 1
+            output_path = partition_dir / file_name
+            group = group.drop(columns=[self._partition_by])
+
+            if self._file_format == 'parquet':
+                writer = _ParquetPageWriter(str(output_path), self._dimensions, self._compression)
+                try:
+                    writer.write(group)
+                except BaseException:
+                    writer.close(completed=False)
+                    raise
+                writer.close()
+            else:
+                tmp_path = _staging_path(str(output_path))
+                group.to_csv(tmp_path, index=False)
+                os.replace(tmp_path, output_path)
+
+    def close(self, completed: bool = True) -> None:
+        for partition_dir in self._touched_partitions:
+            for path in partition_dir.glob('part-*'):
+                # A failed run only removes its own files, so earlier runs stay intact
+                if (self._run_id in path.name) != completed:
+                    path.unlink(missing_ok=True)
+
+            if not completed and not any(partition_dir.iterdir()):
+                partition_dir.rmdir()
+
+
+class QuotaTracker:
+    """
+    Tracks GA4 property quota and paces requests to stay under it.
+
+    Every request asks the API to return its property quota state. The
+    tracker keeps the latest remaining tokens per day, per hour and per
+    project per hour, estimates the cost of a request from the tokens recent
+    requests consumed, and limits the number of concurrent requests. Before a
+    request is sent, ``acquire`` blocks until it fits: concurrency slots are
+    waited for, an exhausted hourly budget waits for the next hour and an
+    exhausted daily budget raises until the daily quota resets. Coroutines
+    use ``acquire_async`` and ``release_async`` instead, which wait without
+    blocking the event loop.
+    """
+
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+    INITIAL_TOKENS_PER_REQUEST = 10.0
+    # Weight of the latest request in the moving average of tokens per request
+    ESTIMATE_SMOOTHING = 0.2
+
+    def __init__(self, max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS):
+        """
+        Initialize the quota tracker.
+
+        Args:
+            max_concurrent_requests: Maximum number of requests in flight at once
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.tokens_per_day: Optional[int] = None
+        self.tokens_per_hour: Optional[int] = None
+        self.tokens_per_project_per_hour: Optional[int] = None
+        self.tokens_per_request = self.INITIAL_TOKENS_PER_REQUEST
+        self._in_flight = 0
+        self._hour_started_at = self._current_hour()
+        self._day_started_at = self._current_day()
+        self._condition = threading.Condition()
+        # asyncio primitives belong to one event loop, so the slots are created per loop
+        self._async_slots: Optional[asyncio.Semaphore] = None
+        self._async_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _current_hour() -> float:
+        return time.time() // 3600 * 3600
+
+    @staticmethod
+    def _current_day() -> date:
+        # GA4 resets daily property quotas at midnight Pacific time
+        try:
+            from zoneinfo import ZoneInfo
+            return datetime.now(ZoneInfo('America/Los_Angeles')).date()
+        except (ImportError, KeyError):
+            # Without tz data the local date approximates the boundary
+            return date.today()
+
+    def _reserved_tokens(self) -> float:
+        return (self._in_flight + 1) * self.tokens_per_request
+
+    def acquire(self) -> None:
+        """
+        Block until a request fits within the tracked quota.
+
+        Raises:
+            RuntimeError: If the daily token quota is exhausted
+        """
+        with self._condition:
+            while True:
+                self._check_budgets()
+
+                if self._in_flight >= self.max_concurrent_requests:
+                    self._condition.wait()
+                    continue
+
+                wait_seconds = self._hourly_wait()
+                if wait_seconds is not None:
+                    self._condition.wait(timeout=wait_seconds)
+                    continue
+
+                self._in_flight += 1
+                return
+
+    async def acquire_async(self) -> None:
+        """
+        Wait until a request fits within the tracked quota, without blocking the event loop.
+
+        Concurrency is limited by an asyncio.Semaphore of max_concurrent_requests
+        slots; every successful call must be paired with release_async.
+
+        Raises:
+            RuntimeError: If the daily token quota is exhausted
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_slots_loop is not loop:
+            self._async_slots = asyncio.Semaphore(self.max_concurrent_requests)
+            self._async_slots_loop = loop
+        slots = self._async_slots
+
+        await slots.acquire()
+        try:
+            while True:
+                with self._condition:
+                    self._check_budgets()
+                    wait_seconds = self._hourly_wait()
+                    if wait_seconds is None:
+                        self._in_flight += 1
+                        return
+                await asyncio.sleep(wait_seconds)
+        except BaseException:
+            slots.release()
+            raise
+
+    def release_async(self, response: Optional[RunReportResponse] = None) -> None:
+        """
+        Release a slot taken with acquire_async and record the quota state of a response.
+
+        Args:
+            response: RunReportResponse of the finished request, if any
+        """
+        self.release(response)
+        self._async_slots.release()
+
+    def _check_budgets(self) -> None:
+        """
+        Refill elapsed budgets and fail if the daily budget can't fit a request.
+
+        Must be called with the condition held.
+
+        Raises:
+            RuntimeError: If the daily token quota is exhausted
+        """
+        # Hourly budgets refill at the top of the hour
+        if self._current_hour() > self._hour_started_at:
+            self._hour_started_at = self._current_hour()
+            self.tokens_per_hour = None
+            self.tokens_per_project_per_hour = None
+
+        # The daily budget refills at the day boundary
+        if self._current_day() > self._day_started_at:
+            self._day_started_at = self._current_day()
+            self.tokens_per_day = None
+
+        if self.tokens_per_day is not None and self.tokens_per_day < self._reserved_tokens():
+            raise RuntimeError(
+                f"Daily token quota exhausted ({self.tokens_per_day} tokens remaining)"
+            )
+
+    def _hourly_wait(self) -> Optional[float]:
+        """
+        Return the seconds until the hourly budget refills if it can't fit a request.
+
+        Must be called with the condition held.
+
+        Returns:
+            Seconds to wait, or None if the request fits the hourly budgets
+        """
+        hourly_remaining = [
+            tokens for tokens in (self.tokens_per_hour, self.tokens_per_project_per_hour)
+            if tokens is not None
+        ]
+        if not hourly_remaining or min(hourly_remaining) >= self._reserved_tokens():
+            return None
+
+        wait_seconds = max(self._hour_started_at + 3600 - time.time(), 0)
+        logger.warning(f"Hourly token quota nearly exhausted, pausing for {wait_seconds:.0f}s")
+        return wait_seconds
+
+    def release(self, response: Optional[RunReportResponse] = None) -> None:
+        """
+        Release a concurrency slot and record the quota state of a response.
+
+        Args:
+            response: RunReportResponse of the finished request, if any
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if response is not None:
+                self._update(response)
+            self._condition.notify_all()
+
+    def update(self, response: RunReportResponse) -> None:
+        """
+        Record the quota state returned with a response.
+
+        Args:
+            response: RunReportResponse carrying property_quota
+        """
+        with self._condition:
+            self._update(response)
+            self._condition.notify_all()
+
+    def _update(self, response: RunReportResponse) -> None:
+        if 'property_quota' not in response:
+            return
+
+        quota = response.property_quota
+        self.tokens_per_day = quota.tokens_per_day.remaining
+        self.tokens_per_hour = quota.tokens_per_hour.remaining
+        self.tokens_per_project_per_hour = quota.tokens_per_project_per_hour.remaining
+
+        consumed = quota.tokens_per_hour.consumed
+        if consumed:
+            self.tokens_per_request += self.ESTIMATE_SMOOTHING * (consumed - self.tokens_per_request)
+
+
+class Instrumentation:
+    """
+    Receives per-stage timings of report runs.
+
+    All hooks are no-ops; subclass and override the ones of interest and pass
+    an instance to the client. When no instrumentation is given the clients
+    skip the hooks entirely, including the byte count of responses.
+    """
+
+    def on_page(self, property_id: str, offset: int, rows: int, bytes_received: int, seconds: float) -> None:
+        """
+        Called after a page was fetched from the API (not from cache or checkpoint).
+
+        Args:
+            property_id: GA4 property ID of the report
+            offset: Starting row offset of the page
+            rows: Number of rows in the page
+            bytes_received: Serialized size of the response
+            seconds: Time spent in the RPC, including retries and quota waits
+        """
+
+    def on_conversion(self, rows: int, seconds: float) -> None:
+        """
+        Called after rows were converted to a DataFrame.
+
+        Args:
+            rows: Number of rows converted
+            seconds: Time spent building the DataFrame
+        """
+
+    def on_write(self, file_format: str, rows: int, seconds: float) -> None:
+        """
+        Called after an exported page was written to disk.
+
+        Args:
+            file_format: 'csv' or 'parquet'
+            rows: Number of rows written
+            seconds: Time spent writing the page
+        """
+
+    def on_export(self, file_format: str, rows: int, seconds: float) -> None:
+        """
+        Called after an export finished.
+
+        Args:
+            file_format: 'csv' or 'parquet'
+            rows: Total number of rows exported
+            seconds: Wall time of the whole export
+        """
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Records stage timings as Prometheus metrics via prometheus_client.
+
+    Rows per second can be derived with e.g.
+    ``rate(ga4_rows_fetched_total[5m])``.
+    """
+
+    def __init__(self, registry: Optional[Any] = None, namespace: str = 'ga4'):
+        """
+        Args:
+            registry: prometheus_client CollectorRegistry; the default registry if None
+            namespace: Prefix of the metric names
+        """
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError as e:
+            raise ImportError("Prometheus metrics require prometheus_client: pip install prometheus-client") from e
+
+        registry = registry or REGISTRY
+        self.page_seconds = Histogram(
+            'page_seconds', 'Latency of report page requests', ['property_id'],
+            namespace=namespace, registry=registry
+        )
+        self.bytes_received = Counter(
+            'bytes_received', 'Serialized bytes of report pages', ['property_id'],
+            namespace=namespace, registry=registry
+        )
+        self.rows_fetched = Counter(
+            'rows_fetched', 'Rows received from the API', ['property_id'],
+            namespace=namespace, registry=registry
+        )
+        self.conversion_seconds = Histogram(
+            'conversion_seconds', 'Time spent converting rows to DataFrames',
+            namespace=namespace, registry=registry
+        )
+        self.write_seconds = Histogram(
+            'write_seconds', 'Time spent writing exported pages', ['format'],
+            namespace=namespace, registry=registry
+        )
+        self.export_seconds = Histogram(
+            'export_seconds', 'Wall time of exports', ['format'],
+            namespace=namespace, registry=registry
+        )
+
+    def on_page(self, property_id: str, offset: int, rows: int, bytes_received: int, seconds: float) -> None:
+        self.page_seconds.labels(property_id).observe(seconds)
+        self.bytes_received.labels(property_id).inc(bytes_received)
+        self.rows_fetched.labels(property_id).inc(rows)
+
+    def on_conversion(self, rows: int, seconds: float) -> None:
+        self.conversion_seconds.observe(seconds)
+
+    def on_write(self, file_format: str, rows: int, seconds: float) -> None:
+        self.write_seconds.labels(file_format).observe(seconds)
+
+    def on_export(self, file_format: str, rows: int, seconds: float) -> None:
+        self.export_seconds.labels(file_format).observe(seconds)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Records stage timings as OpenTelemetry metrics."""
+
+    def __init__(self, meter: Optional[Any] = None):
+        """
+        Args:
+            meter: OpenTelemetry Meter; one from the global meter provider if None
+        """
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError("OpenTelemetry metrics require opentelemetry-api: pip install opentelemetry-api") from e
+
+        meter = meter or metrics.get_meter(__name__)
+        self.page_duration = meter.create_histogram(
+            'ga4.page.duration', unit='s', description='Latency of report page requests'
+        )
+        self.bytes_received = meter.create_counter(
+            'ga4.page.bytes', unit='By', description='Serialized bytes of report pages'
+        )
+        self.rows_fetched = meter.create_counter(
+            'ga4.page.rows', unit='{row}', description='Rows received from the API'
+        )
+        self.page_throughput = meter.create_histogram(
+            'ga4.page.throughput', unit='{row}/s', description='Rows per second of report pages'
+        )
+        self.conversion_duration = meter.create_histogram(
+            'ga4.conversion.duration', unit='s', description='Time spent converting rows to DataFrames'
+        )
+        self.write_duration = meter.create_histogram(
+            'ga4.export.write.duration', unit='s', description='Time spent writing exported pages'
+        )
+        self.export_duration = meter.create_histogram(
+            'ga4.export.duration', unit='s', description='Wall time of exports'
+        )
+
+    def on_page(self, property_id: str, offset: int, rows: int, bytes_received: int, seconds: float) -> None:
+        attributes = {'ga4.property_id': property_id}
+        self.page_duration.record(seconds, attributes)
+        self.bytes_received.add(bytes_received, attributes)
+        self.rows_fetched.add(rows, attributes)
+        if seconds > 0:
+            self.page_throughput.record(rows / seconds, attributes)
+
+    def on_conversion(self, rows: int, seconds: float) -> None:
+        self.conversion_duration.record(seconds)
+
+    def on_write(self, file_format: str, rows: int, seconds: float) -> None:
+        self.write_duration.record(seconds, {'ga4.format': file_format})
+
+    def on_export(self, file_format: str, rows: int, seconds: float) -> None:
+        self.export_duration.record(seconds, {'ga4.format': file_format})
+
+
+class _BaseGA4Client:
+    """
+    Shared configuration, request construction and DataFrame conversion.
+
+    Subclasses provide the transport: GA4AnalyticsClient wraps the synchronous
+    BetaAnalyticsDataClient and AsyncGA4AnalyticsClient the asyncio one.
+    """
+
+    MAX_ROWS_PER_REQUEST = 250000
+    MAX_REPORTS_PER_BATCH = 5
+    DEFAULT_MAX_WORKERS = 4
+    # 'auto' categorical encoding kicks in below this distinct-to-total ratio
+    CATEGORICAL_MAX_RATIO = 0.5
+    VALIDATION_MODES = ('names', 'compatibility')
+
+    def __init__(
+            self,
+            credentials_path: Optional[str] = None,
+            property_id: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            cache: Optional[ResponseCache] = None,
+            quota_tracker: Optional[QuotaTracker] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            channel_options: Sequence[Tuple[str, Any]] = DEFAULT_CHANNEL_OPTIONS,
+            transport: Optional[Any] = None,
+            instrumentation: Optional[Instrumentation] = None,
+            validate: Optional[str] = None
+    ):
+        """
+        Initialize the GA4 Analytics Client.
+
+        Args:
+            credentials_path: Path to service account credentials JSON file
+            property_id: GA4 property ID
+            max_workers: Maximum number of pages fetched concurrently
+            cache: Optional on-disk cache of API responses
+            quota_tracker: Tracker pacing requests within the property quota
+            retry_policy: Backoff policy for transient API errors
+            channel_options: gRPC options of the pooled channel used by the
+                synchronous client
+            transport: Optional transport overriding the default connection,
+                e.g. one pointing at a local fake server; credentials are
+                not loaded when it is given
+            instrumentation: Optional hooks receiving per-page, conversion
+                and export timings
+            validate: Validate reports before fetching them: 'names' checks
+                dimension and metric names against the cached property
+                metadata, 'compatibility' additionally asks the API whether
+                they can be combined; None disables validation
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if validate is not None and validate not in self.VALIDATION_MODES:
+            raise ValueError(f"validate must be one of {self.VALIDATION_MODES} or None, got '{validate}'")
+
+        if credentials_path is None or property_id is None:
+            _load_environment()
+
+        self.credentials_path = credentials_path or os.getenv('GA4_CREDENTIALS_PATH')
+        self.property_id = property_id or os.getenv('GA4_PROPERTY_ID')
+        self.max_workers = max_workers
+        self.cache = cache
+        self.quota_tracker = quota_tracker or QuotaTracker()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.channel_options = channel_options
+        self.transport = transport
+        self.instrumentation = instrumentation
+        self.validate = validate
+        self.last_request_count = 0
+        self._client = None
+        # Optional cap on requests in flight shared by several clients
+        self._request_slots: Optional[threading.BoundedSemaphore] = None
+
+    def _create_filter_expressions(self, dimensions_filter: Dict[str, Any]) -> List[FilterExpression]:
+        """
+        Create filter expressions based on dimension filters.
+
+        Args:
+            dimensions_filter: Dictionary mapping dimension names to filter values
+
+        Returns:
+            List of FilterExpression objects
+        """
+        from google.analytics.data_v1beta.types import Filter, FilterExpression
+
+        filter_expressions = []
+
+        for dimension, values in dimensions_filter.items():
+            if isinstance(values, list):
+                # Use "in list" filter for multiple values
+                filter_expressions.append(
+                    FilterExpression(
+                        filter=Filter(
+                            field_name=dimension,
+                            in_list_filter=Filter.InListFilter(values=values)
+                        )
+                    )
+                )
+            elif isinstance(values, str):
+                # Use "contains" filter for single string value
+                filter_expressions.append(
+                    FilterExpression(
+                        filter=Filter(
+                            field_name=dimension,
+                            string_filter=Filter.StringFilter(
+                                match_type=Filter.StringFilter.MatchType.CONTAINS,
+                                value=values
+                            )
+                        )
+                    )
+                )
+
+        return filter_expressions
+
+    def _create_request(
+            self,
+            start_date: str,
+            end_date: str,
+            dimensions: Optional[List[str]] = None,
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            offset: int = 0,
+            limit: int = None
+    ) -> RunReportRequest:
+        """
+        Create a RunReportRequest object.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format or 'today'
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            offset: Starting row offset
+            limit: Maximum rows to return
+
+        Returns:
+            RunReportRequest object
+        """
+        from google.analytics.data_v1beta.types import (
+            FilterExpression,
+            FilterExpressionList,
+            OrderBy,
+            RunReportRequest
+        )
+
+        dimensions = dimensions or []
+        metrics = metrics or []
+        limit = limit or self.MAX_ROWS_PER_REQUEST
+
+        request_dict = {
+            "property": f"properties/{self.property_id}",
+            "date_ranges": [{"start_date": start_date, "end_date": end_date}],
+            "dimensions": [{"name": dim} for dim in dimensions],
+            "metrics": [{"name": metric} for metric in metrics],
+            "keep_empty_rows": True,
+            "return_property_quota": True,
+            "offset": offset,
+            "limit": limit
+        }
+
+        # Apply dimension filters if provided
+        if dimensions_filter:
+            request_dict["dimension_filter"] = FilterExpression(
+                or_group=FilterExpressionList(
+                    expressions=self._create_filter_expressions(dimensions_filter)
+                )
+            )
+
+        # Apply ordering
+        if not order_bys and dimensions:
+            order_bys = dimensions  # Default to ordering by dimensions
+
+        if order_bys:
+            request_dict["order_bys"] = [
+                OrderBy(dimension={"dimension_name": order_by})
+                for order_by in order_bys
+            ]
+
+        return RunReportRequest(**request_dict)
+
+    def _create_page_request(self, request_kwargs: Dict[str, Any], offset: int) -> RunReportRequest:
+        """
+        Create the request for a single page of a report.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            offset: Starting row offset of the page
+
+        Returns:
+            RunReportRequest object
+        """
+        return self._create_request(
+            **request_kwargs,
+            offset=offset,
+            limit=self.MAX_ROWS_PER_REQUEST
+        )
+
+    def _split_report_spec(self, spec: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split a report spec into request and conversion keyword arguments.
+
+        Args:
+            spec: Dictionary of get_report keyword arguments
+
+        Returns:
+            Tuple of (request_kwargs for _create_request, conversion options)
+
+        Raises:
+            ValueError: If the spec contains unknown keys
+        """
+        request_keys = {'start_date', 'end_date', 'dimensions', 'metrics', 'dimensions_filter', 'order_bys'}
+        conversion_keys = {'convert_date_columns', 'categorical_dimensions'}
+
+        unknown_keys = set(spec) - request_keys - conversion_keys
+        if unknown_keys:
+            raise ValueError(f"Unknown report spec keys: {sorted(unknown_keys)}")
+
+        request_kwargs = {
+            "start_date": spec['start_date'],
+            "end_date": spec['end_date'],
+            "dimensions": spec.get('dimensions') or [],
+            "metrics": spec.get('metrics') or [],
+            "dimensions_filter": spec.get('dimensions_filter'),
+            "order_bys": spec.get('order_bys')
+        }
+        conversion_options = {
+            "convert_date_columns": spec.get('convert_date_columns', True),
+            "categorical_dimensions": spec.get('categorical_dimensions')
+        }
+
+        return request_kwargs, conversion_options
+
+    def _metadata_names(self, metadata: Any) -> Tuple[frozenset, frozenset]:
+        """
+        Extract the dimension and metric API names from property metadata.
+
+        Args:
+            metadata: Metadata returned by get_metadata
+
+        Returns:
+            Tuple of (dimension names, metric names)
+        """
+        return (
+            frozenset(dimension.api_name for dimension in metadata.dimensions),
+            frozenset(metric.api_name for metric in metadata.metrics)
+        )
+
+    def _check_names(
+            self,
+            property_id: str,
+            names: Tuple[frozenset, frozenset],
+            dimensions: List[str],
+            metrics: List[str],
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None
+    ) -> None:
+        """
+        Check report names against the metadata of a property.
+
+        Raises:
+            ValueError: If a dimension or metric does not exist for the property
+        """
+        known_dimensions, known_metrics = names
+        requested_dimensions = list(dimensions) + list(dimensions_filter or {}) + list(order_bys or [])
+        unknown_dimensions = sorted({name for name in requested_dimensions if name not in known_dimensions})
+        unknown_metrics = sorted({name for name in metrics if name not in known_metrics})
+
+        if unknown_dimensions or unknown_metrics:
+            logger.error(
+                f"Invalid report for property {property_id}: unknown dimensions "
+                f"{unknown_dimensions}, unknown metrics {unknown_metrics}"
+            )
+            raise ValueError(
+                f"Unknown names for property {property_id}: dimensions {unknown_dimensions}, "
+                f"metrics {unknown_metrics}"
+            )
+
+    def _compatibility_key(
+            self,
+            property_id: str,
+            dimensions: List[str],
+            metrics: List[str],
+            dimensions_filter: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Build the cache key of a compatibility check.
+
+        Filtered dimensions are included since they must be compatible with
+        the metrics as well.
+        """
+        return (
+            property_id,
+            tuple(sorted(set(dimensions) | set(dimensions_filter or {}))),
+            tuple(sorted(set(metrics)))
+        )
+
+    def _create_compatibility_request(self, key: Tuple[str, Tuple[str, ...], Tuple[str, ...]]) -> Any:
+        """
+        Create a CheckCompatibilityRequest listing only incompatible fields.
+
+        Args:
+            key: Compatibility key from _compatibility_key
+
+        Returns:
+            CheckCompatibilityRequest object
+        """
+        from google.analytics.data_v1beta.types import CheckCompatibilityRequest, Compatibility
+
+        property_id, dimensions, metrics = key
+        return CheckCompatibilityRequest(
+            property=f"properties/{property_id}",
+            dimensions=[{"name": dimension} for dimension in dimensions],
+            metrics=[{"name": metric} for metric in metrics],
+            compatibility_filter=Compatibility.INCOMPATIBLE
+        )
+
+    def _incompatible_names(self, response: Any) -> Tuple[List[str], List[str]]:
+        """
+        Extract incompatible dimension and metric names from a compatibility response.
+
+        Args:
+            response: CheckCompatibilityResponse
+
+        Returns:
+            Tuple of (incompatible dimensions, incompatible metrics)
+        """
+        from google.analytics.data_v1beta.types import Compatibility
+
+        return (
+            [
+                item.dimension_metadata.api_name for item in response.dimension_compatibilities
+                if item.compatibility == Compatibility.INCOMPATIBLE
+            ],
+            [
+                item.metric_metadata.api_name for item in response.metric_compatibilities
+                if item.compatibility == Compatibility.INCOMPATIBLE
+            ]
+        )
+
+    def _check_compatible(self, property_id: str, incompatible: Tuple[List[str], List[str]]) -> None:
+        """
+        Raises:
+            ValueError: If the API reported incompatible dimensions or metrics
+        """
+        incompatible_dimensions, incompatible_metrics = incompatible
+        if incompatible_dimensions or incompatible_metrics:
+            logger.error(
+                f"Incompatible report for property {property_id}: dimensions "
+                f"{incompatible_dimensions}, metrics {incompatible_metrics}"
+            )
+            raise ValueError(
+                f"Incompatible names for property {property_id}: dimensions "
+                f"{incompatible_dimensions}, metrics {incompatible_metrics}"
+            )
+
+    def _get_metric_types(self, response: RunReportResponse) -> List[MetricType]:
+        """
+        Read metric types from the metric headers of a response.
+
+        Args:
+            response: RunReportResponse carrying metric_headers
+
+        Returns:
+            List of MetricType values, one per metric
+        """
+        return [header.type_ for header in response.metric_headers]
+
+    def _record_page(self, offset: int, response: RunReportResponse, seconds: float) -> None:
+        """
+        Report a fetched page to the instrumentation, if any.
+
+        Args:
+            offset: Starting row offset of the page
+            response: RunReportResponse of the page
+            seconds: Time spent fetching the page
+        """
+        if self.instrumentation is None:
+            return
+
+        from google.analytics.data_v1beta.types import RunReportResponse
+
+        self.instrumentation.on_page(
+            self.property_id,
+            offset,
+            len(response.rows),
+            RunReportResponse.pb(response).ByteSize(),
+            seconds
+        )
+
+    def _annotate_page_span(self, span: Any, request: RunReportRequest, response: RunReportResponse) -> None:
+        """
+        Attach request fingerprint, row counts and remaining quota to a page span.
+
+        Args:
+            span: Span of the run_report call
+            request: RunReportRequest of the page
+            response: RunReportResponse of the page
+        """
+        if not span.is_recording():
+            return
+
+        span.set_attribute("ga4.request.fingerprint", ResponseCache.fingerprint(request))
+        span.set_attribute("ga4.page.rows", len(response.rows))
+        span.set_attribute("ga4.report.row_count", response.row_count)
+        if 'property_quota' in response:
+            quota = response.property_quota
+            span.set_attribute("ga4.quota.tokens_per_day.remaining", quota.tokens_per_day.remaining)
+            span.set_attribute("ga4.quota.tokens_per_hour.remaining", quota.tokens_per_hour.remaining)
+            span.set_attribute("ga4.quota.tokens_per_hour.consumed", quota.tokens_per_hour.consumed)
+
+    def _is_last_page(self, offset: int, page_size: int, row_count: int) -> bool:
+        """
+        Check whether a page is the final page of a report.
+
+        Args:
+            offset: Starting row offset of the page
+            page_size: Number of rows returned in the page
+            row_count: Total row count reported by the API
+
+        Returns:
+            True if no further pages need to be requested
+        """
+        return offset + page_size >= row_count or page_size < self.MAX_ROWS_PER_REQUEST
+
+    def _convert_to_dataframe(
+            self,
+            all_data: List[Any],
+            dimensions: List[str],
+            metrics: List[str],
+            metric_types: Optional[List[MetricType]] = None,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None
+    ) -> pd.DataFrame:
+        """
+        Convert API response data to pandas DataFrame.
+
+        Values are gathered column by column straight from the underlying
+        protobuf rows, so no per-row dictionary is ever built. Metrics whose
+        type is known are parsed directly into int64/float64 columns; the
+        rest are kept as strings. Dimension columns can be stored as pandas
+        Categoricals, see ``categorical_dimensions``.
+
+        Args:
+            all_data: List of row data from API response
+            dimensions: List of dimension names
+            metrics: List of metric names
+            metric_types: Metric types from the response metric headers
+            categorical_dimensions: Dimensions to encode as categoricals: a list
+                of names, 'all', 'auto' (based on cardinality) or None
+
+        Returns:
+            pandas DataFrame with the data
+        """
+        import pandas as pd
+        from google.analytics.data_v1beta.types import Row
+
+        with _start_span("ga4.convert", {"ga4.rows": len(all_data)}):
+            started = time.perf_counter()
+            try:
+                # Unwrap proto-plus rows once; raw protobuf field access is much cheaper
+                rows = [Row.pb(row) if isinstance(row, Row) else row for row in all_data]
+                columns = {}
+
+                # Add dimension values
+                for i, dimension in enumerate(dimensions):
+                    values = [row.dimension_values[i].value for row in rows]
+                    if self._use_categorical(dimension, values, categorical_dimensions):
+                        values = pd.Categorical(values)
+                    columns[dimension] = values
+
+                # Add metric values
+                metric_types = metric_types or [None] * len(metrics)
+                for i, (metric, metric_type) in enumerate(zip(metrics, metric_types)):
+                    columns[metric] = self._parse_metric_column(rows, i, metric_type)
+
+                df = pd.DataFrame(columns, columns=dimensions + metrics)
+                logger.info(f"Successfully converted {len(df)} rows to DataFrame")
+                if self.instrumentation is not None:
+                    self.instrumentation.on_conversion(len(df), time.perf_counter() - started)
+                return df
+
+            except Exception as e:
+                logger.error(f"Failed to convert response to DataFrame: {e}")
+                raise RuntimeError(f"DataFrame conversion failed: {e}")
+
+    def _use_categorical(
+            self,
+            dimension: str,
+            values: List[str],
+            categorical_dimensions: Optional[Union[str, List[str]]]
+    ) -> bool:
+        """
+        Decide whether a dimension column should be stored as a categorical.
+
+        'all' and 'auto' leave the 'date' dimension out, so it can still be
+        converted to datetime; list it explicitly to encode it anyway.
+
+        Args:
+            dimension: Dimension name
+            values: Dimension values of the column
+            categorical_dimensions: Dimensions to encode as categoricals: a list
+                of names, 'all', 'auto' (based on cardinality) or None
+
+        Returns:
+            True if the column should be encoded as a categorical
+        """
+        if not categorical_dimensions:
+            return False
+        if categorical_dimensions == 'all':
+            return dimension != 'date'
+        if categorical_dimensions == 'auto':
+            return (
+                dimension != 'date'
+                and len(values) > 0
+                and len(set(values)) <= self.CATEGORICAL_MAX_RATIO * len(values)
+            )
+        if isinstance(categorical_dimensions, str):
+            raise ValueError(
+                f"categorical_dimensions must be a list, 'all' or 'auto', got '{categorical_dimensions}'"
+            )
+        return dimension in categorical_dimensions
+
+    def _pin_categorical_dimensions(
+            self,
+            df: pd.DataFrame,
+            dimensions: List[str],
+            categorical_dimensions: Optional[Union[str, List[str]]]
+    ) -> Optional[Union[str, List[str]]]:
+        """
+        Fix an 'auto' categorical decision to the columns encoded in a page.
+
+        Streaming reports decide 'auto' once, from the first page, so every
+        page of the report has the same column types.
+
+        Args:
+            df: First page of the report, as returned by _convert_to_dataframe
+            dimensions: List of dimension names
+            categorical_dimensions: Dimensions to encode as categoricals
+
+        Returns:
+            The dimensions encoded in df when categorical_dimensions is 'auto',
+            otherwise categorical_dimensions unchanged
+        """
+        import pandas as pd
+
+        if categorical_dimensions != 'auto':
+            return categorical_dimensions
+        return [dimension for dimension in dimensions if isinstance(df[dimension].dtype, pd.CategoricalDtype)]
+
+    def _parse_metric_column(self, rows: List[Any], index: int, metric_type: Optional[MetricType]) -> Any:
+        """
+        Parse one metric column according to its metric type.
+
+        Args:
+            rows: Raw protobuf rows
+            index: Position of the metric in metric_values
+            metric_type: Metric type from the response metric header, if known
+
+        Returns:
+            numpy array for numeric metrics, list of strings otherwise
+        """
+        import numpy as np
+        import pandas as pd
+
+        values = (row.metric_values[index].value for row in rows)
+        type_name = getattr(metric_type, 'name', None)
+
+        try:
+            if type_name in INTEGER_METRIC_TYPES:
+                return np.fromiter(map(int, values), dtype=np.int64, count=len(rows))
+            if type_name in FLOAT_METRIC_TYPES:
+                return np.fromiter(map(float, values), dtype=np.float64, count=len(rows))
+        except ValueError:
+            # Fall back to a lenient parse if the API returned a non-numeric value
+            strings = [row.metric_values[index].value for row in rows]
+            return pd.to_numeric(strings, errors='coerce')
+
+        return [row.metric_values[index].value for row in rows]
+
+    def _convert_date_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the 'date' column from YYYYMMDD strings to datetime.
+
+        A categorical 'date' column keeps its codes and gets datetime categories.
+
+        Args:
+            df: DataFrame returned by _convert_to_dataframe
+
+        Returns:
+            DataFrame with the 'date' column converted, if present
+        """
+        import pandas as pd
+
+        if 'date' in df.columns:
+            if isinstance(df['date'].dtype, pd.CategoricalDtype):
+                categories = pd.to_datetime(df['date'].cat.categories, format='%Y%m%d')
+                df['date'] = df['date'].cat.rename_categories(categories)
+            else:
+                df['date'] = pd.to_datetime(df['date'], format='%Y%m%d')
+            logger.info("Converted 'date' column to datetime format")
+
+        return df
+
+
+class GA4AnalyticsClient(_BaseGA4Client):
+    """
+    A client class for interacting with Google Analytics 4 Reporting API.
+
+    This class provides methods to establish connection, create requests,
+    run paginated queries, and convert responses to pandas DataFrames.
+    """
+
+    @property
+    def client(self) -> BetaAnalyticsDataClient:
+        """
+        Lazy initialization of the GA4 client.
+
+        Returns:
+            BetaAnalyticsDataClient: Authenticated client instance
+        """
+        if self._client is None:
+            self._client = self._establish_connection()
+        return self._client
+
+    def _establish_connection(self) -> BetaAnalyticsDataClient:
+        """
+        Establish connection to GA4 API using service account credentials.
+
+        The client is taken from the process-wide channel pool, so instances
+        sharing a credentials file reuse one authenticated channel.
+
+        Returns:
+            BetaAnalyticsDataClient: Authenticated client
+
+        Raises:
+            RuntimeError: If connection establishment fails
+        """
+        try:
+            if self.transport is not None:
+                from google.analytics.data_v1beta import BetaAnalyticsDataClient
+                return BetaAnalyticsDataClient(transport=self.transport)
+
+            client = channel_pool.get_client(self.credentials_path, self.channel_options)
+            logger.info("Successfully established connection to GA4 API")
+            return client
+        except Exception as e:
+            logger.error(f"Failed to establish connection: {e}")
+            raise RuntimeError(f"Failed to establish GA4 API connection: {e}")
+
+    def _call_with_retry(
+            self,
+            call: Callable[[], Any],
+            description: str,
+            counter: Optional[_RequestCounter] = None,
+            retry_budget: Optional[_RetryBudget] = None
+    ) -> Any:
+        """
+        Run an API call within the quota, retrying transient errors.
+
+        Args:
+            call: Function issuing the API call
+            description: Description of the call used in log and error messages
+            counter: Optional counter of requests issued for the current report
+            retry_budget: Optional retry budget shared by the pages of the report
+
+        Returns:
+            Result of the API call
+
+        Raises:
+            RuntimeError: If the call fails with a fatal error or retries run out
+        """
+        attempt = 0
+        while True:
+            if counter is not None:
+                counter.increment()
+
+            # The quota may raise once the daily budget is spent, so take it
+            # before the shared slot, which must only be held inside the try
+            self.quota_tracker.acquire()
+            if self._request_slots is not None:
+                self._request_slots.acquire()
+            try:
+                return call()
+            except Exception as e:
+                if not self.retry_policy.should_retry(e, attempt, retry_budget):
+                    logger.error(f"Failed to run request {description}: {e}")
+                    raise RuntimeError(f"API request failed {description}: {e}")
+                delay = self.retry_policy.delay(attempt)
+                logger.warning(
+                    f"Retryable error {description} (attempt {attempt + 1}): {e}. "
+                    f"Retrying in {delay:.1f}s"
+                )
+            finally:
+                self.quota_tracker.release()
+                if self._request_slots is not None:
+                    self._request_slots.release()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _validate_report(
+            self,
+            dimensions: List[str],
+            metrics: List[str],
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            property_id: Optional[str] = None
+    ) -> None:
+        """
+        Validate a report spec before any page is requested.
+
+        Does nothing unless ``validate`` is set. Property metadata and
+        compatibility answers come from ``metadata_cache`` when available, so
+        repeated specs are validated without API calls.
+
+        Args:
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            property_id: Property to validate against; this client's by default
+
+        Raises:
+            ValueError: If the spec uses unknown or incompatible names
+            RuntimeError: If the metadata or compatibility request fails
+        """
+        if self.validate is None:
+            return
+
+        property_id = property_id or self.property_id
+        names = metadata_cache.get_names(property_id)
+        if names is None:
+            metadata = self._call_with_retry(
+                lambda: self.client.get_metadata(name=f"properties/{property_id}/metadata"),
+                f"for metadata of property {property_id}"
+            )
+            names = self._metadata_names(metadata)
+            metadata_cache.put_names(property_id, names)
+
+        self._check_names(property_id, names, dimensions, metrics, dimensions_filter, order_bys)
+
+        if self.validate != 'compatibility':
+            return
+
+        key = self._compatibility_key(property_id, dimensions, metrics, dimensions_filter)
+        incompatible = metadata_cache.get_incompatible(key)
+        if incompatible is None:
+            request = self._create_compatibility_request(key)
+            response = self._call_with_retry(
+                lambda: self.client.check_compatibility(request),
+                f"for compatibility check of property {property_id}"
+            )
+            incompatible = self._incompatible_names(response)
+            metadata_cache.put_incompatible(key, incompatible)
+
+        self._check_compatible(property_id, incompatible)
+
+    def _fetch_page(
+            self,
+            request_kwargs: Dict[str, Any],
+            offset: int,
+            counter: Optional[_RequestCounter] = None,
+            retry_budget: Optional[_RetryBudget] = None,
+            checkpoint: Optional[_PageCheckpoint] = None
+    ) -> RunReportResponse:
+        """
+        Fetch a single page of a report, consulting the checkpoint and the
+        response cache first.
+
+        Transient errors are retried according to ``retry_policy``.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            offset: Starting row offset of the page
+            counter: Optional counter of requests issued for the current report
+            retry_budget: Optional retry budget shared by the pages of the report
+            checkpoint: Optional staging directory of a resumable report
+
+        Returns:
+            RunReportResponse for the requested page
+
+        Raises:
+            RuntimeError: If the API request fails
+        """
+        if checkpoint is not None:
+            stored = checkpoint.load(offset)
+            if stored is not None:
+                logger.info(f"Loaded offset {offset} from checkpoint")
+                return stored
+
+        request = self._create_page_request(request_kwargs, offset)
+
+        if self.cache is not None:
+            cached = self.cache.get(request)
+            if cached is not None:
+                logger.info(f"Cache hit for offset {offset}")
+                return cached
+
+        with _start_span("ga4.run_report", {"ga4.property_id": self.property_id, "ga4.offset": offset}) as span:
+            started = time.perf_counter()
+            response = self._call_with_retry(
+                lambda: self.client.run_report(request),
+                f"at offset {offset}",
+                counter,
+                retry_budget
+            )
+            self.quota_tracker.update(response)
+            self._record_page(offset, response, time.perf_counter() - started)
+            self._annotate_page_span(span, request, response)
+
+        if self.cache is not None:
+            self.cache.put(request, response)
+
+        if checkpoint is not None:
+            checkpoint.save(offset, response)
+
+        return response
+
+    def _iter_pages(
+            self,
+            request_kwargs: Dict[str, Any],
+            counter: Optional[_RequestCounter] = None,
+            checkpoint: Optional[_PageCheckpoint] = None
+    ) -> Iterator[Tuple[int, RunReportResponse]]:
+        """
+        Yield report pages in offset order as they arrive.
+
+        The first page is fetched on its own to learn the total row count,
+        after which the remaining pages are fetched concurrently on a pool of
+        at most ``max_workers`` threads. Only ``max_workers`` pages are in
+        flight at any time, so memory is bounded by a handful of pages rather
+        than by the size of the report.
+
+        Pagination stops as soon as ``offset + len(rows)`` reaches the
+        reported ``row_count`` or a page comes back short, so no trailing
+        empty request is ever issued.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            counter: Optional counter of requests issued for the current report
+            checkpoint: Optional staging directory of a resumable report
+
+        Yields:
+            Tuples of (offset, RunReportResponse)
+        """
+        retry_budget = self.retry_policy.new_budget()
+        first_page = self._fetch_page(request_kwargs, 0, counter, retry_budget, checkpoint)
+        row_count = first_page.row_count
+        is_last = self._is_last_page(0, len(first_page.rows), row_count)
+
+        logger.info(f"Fetched {len(first_page.rows)} rows (offset: 0, total rows: {row_count})")
+
+        yield 0, first_page
+        del first_page
+
+        if is_last:
+            return
+
+        offsets = iter(range(self.MAX_ROWS_PER_REQUEST, row_count, self.MAX_ROWS_PER_REQUEST))
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def submit_next() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    future = _submit_in_context(
+                        executor, self._fetch_page, request_kwargs, offset, counter, retry_budget, checkpoint
+                    )
+                    pending.append((offset, future))
+
+            try:
+                for _ in range(self.max_workers):
+                    submit_next()
+
+                # Consume futures in submission order so pages stay in offset order
+                while pending:
+                    offset, future = pending.popleft()
+                    response = future.result()
+                    submit_next()
+
+                    is_last = self._is_last_page(offset, len(response.rows), row_count)
+                    logger.info(f"Fetched {len(response.rows)} rows (offset: {offset})")
+
+                    yield offset, response
+                    del response
+
+                    if is_last:
+                        break
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _run_paginated_request(
+            self,
+            start_date: str,
+            end_date: str,
+            dimensions: Optional[List[str]] = None,
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            checkpoint: Optional[_PageCheckpoint] = None
+    ) -> Tuple[List[Any], List[MetricType]]:
+        """
+        Execute paginated requests to fetch all data.
+
+        Pages are fetched concurrently by _iter_pages and collected in offset
+        order. The number of requests made is stored in ``last_request_count``.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format or 'today'
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            checkpoint: Optional staging directory of a resumable report
+
+        Returns:
+            Tuple of (all rows from paginated requests, metric types from the
+            response metric headers)
+        """
+        request_kwargs = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "dimensions_filter": dimensions_filter,
+            "order_bys": order_bys
+        }
+        counter = _RequestCounter()
+        all_rows = []
+        metric_types = []
+
+        logger.info(f"Starting paginated request for date range: {start_date} to {end_date}")
+
+        for offset, response in self._iter_pages(request_kwargs, counter, checkpoint):
+            if offset == 0:
+                metric_types = self._get_metric_types(response)
+            all_rows.extend(response.rows)
+
+        self.last_request_count = counter.value
+        logger.info(
+            f"Pagination finished. Total rows collected: {len(all_rows)} "
+            f"in {counter.value} request(s)"
+        )
+
+        return all_rows, metric_types
+
+    def _open_checkpoint(self, request_kwargs: Dict[str, Any], checkpoint_dir: str) -> _PageCheckpoint:
+        """
+        Open the staging directory of a report, keyed by its request fingerprint.
+
+        Relative dates are resolved before fingerprinting, so a report ending
+        'yesterday' resumed after midnight never reuses the previous day's pages.
+        Callers pass the same resolved dates to the page requests.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            checkpoint_dir: Directory holding the staging directories
+
+        Returns:
+            _PageCheckpoint of the report
+        """
+        request_kwargs = {
+            **request_kwargs,
+            "start_date": _resolve_date(request_kwargs['start_date']).isoformat(),
+            "end_date": _resolve_date(request_kwargs['end_date']).isoformat()
+        }
+        fingerprint = ResponseCache.fingerprint(self._create_page_request(request_kwargs, 0))
+        return _PageCheckpoint(checkpoint_dir, fingerprint)
+
+    def get_report(
+            self,
+            start_date: str,
+            end_date: str,
+            dimensions: Optional[List[str]] = None,
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            convert_date_columns: bool = True,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None,
+            checkpoint_dir: Optional[str] = None,
+            shard_by: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get a complete GA4 report as a pandas DataFrame.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format or 'today'
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals:
+                a list of names, 'all', 'auto' (low-cardinality columns only)
+                or None to keep plain string columns
+            checkpoint_dir: Optional directory where fetched pages are staged
+                so an interrupted report resumes from the last completed page
+            shard_by: Split the date range into 'day', 'week' or 'month' shards
+                fetched in parallel, or 'auto' to size shards from the row
+                count of a probe request; requires 'date' among the dimensions
+
+        Returns:
+            pandas DataFrame with the report data
+
+        Raises:
+            ValueError: If both shard_by and checkpoint_dir are given
+        """
+        if shard_by and checkpoint_dir:
+            raise ValueError("checkpoint_dir is not supported together with shard_by")
+
+        with _start_span("ga4.get_report", {
+            "ga4.property_id": self.property_id,
+            "ga4.start_date": start_date,
+            "ga4.end_date": end_date,
+            "ga4.dimensions": dimensions or [],
+            "ga4.metrics": metrics or []
+        }) as span:
+            dimensions = dimensions or []
+            metrics = metrics or []
+            checkpoint = None
+
+            self._validate_report(dimensions, metrics, dimensions_filter, order_bys)
+
+            if shard_by:
+                df = self._get_sharded_report(
+                    {
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "dimensions": dimensions,
+                        "metrics": metrics,
+                        "dimensions_filter": dimensions_filter,
+                        "order_bys": order_bys
+                    },
+                    shard_by,
+                    convert_date_columns,
+                    categorical_dimensions
+                )
+                span.set_attribute("ga4.rows", len(df))
+                span.set_attribute("ga4.request_count", self.last_request_count)
+                return df
+
+            if checkpoint_dir:
+                # Pin relative dates so every page of a resumable report covers the same days
+                start_date = _resolve_date(start_date).isoformat()
+                end_date = _resolve_date(end_date).isoformat()
+                checkpoint = self._open_checkpoint(
+                    {
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "dimensions": dimensions,
+                        "metrics": metrics,
+                        "dimensions_filter": dimensions_filter,
+                        "order_bys": order_bys
+                    },
+                    checkpoint_dir
+                )
+
+            logger.info(f"Generating report with {len(dimensions)} dimensions and {len(metrics)} metrics")
+
+            # Fetch all data using pagination
+            all_data, metric_types = self._run_paginated_request(
+                start_date=start_date,
+                end_date=end_date,
+                dimensions=dimensions,
+                metrics=metrics,
+                dimensions_filter=dimensions_filter,
+                order_bys=order_bys,
+                checkpoint=checkpoint
+            )
+
+            # Convert to DataFrame
+            df = self._convert_to_dataframe(
+                all_data, dimensions, metrics, metric_types, categorical_dimensions
+            )
+
+            # Convert date columns if requested
+            if convert_date_columns:
+                df = self._convert_date_columns(df)
+
+            if checkpoint is not None:
+                checkpoint.clear()
+
+            span.set_attribute("ga4.rows", len(df))
+            span.set_attribute("ga4.request_count", self.last_request_count)
+            return df
+
+    def _get_sharded_report(
+            self,
+            request_kwargs: Dict[str, Any],
+            shard_by: str,
+            convert_date_columns: bool,
+            categorical_dimensions: Optional[Union[str, List[str]]]
+    ) -> pd.DataFrame:
+        """
+        Get a report by fetching date-range shards in parallel.
+
+        Each shard is an independent paginated report; shards run on up to
+        ``max_workers`` threads and are concatenated in chronological order.
+        Because 'date' is a dimension, rows never span shards. When the
+        effective ordering (order_bys, or the dimensions by default) does not
+        start with 'date', the merged frame is re-sorted by it, so the result
+        matches a single unsharded request.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            shard_by: 'day', 'week', 'month' or 'auto'
+            convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals
+
+        Returns:
+            pandas DataFrame with the report data
+
+        Raises:
+            ValueError: If 'date' is not among the dimensions
+        """
+        import pandas as pd
+
+        dimensions = request_kwargs['dimensions']
+        metrics = request_kwargs['metrics']
+
+        if 'date' not in dimensions:
+            raise ValueError("Sharding by date range requires 'date' among the dimensions")
+
+        today = date.today()
+        start = _resolve_date(request_kwargs['start_date'], today)
+        end = _resolve_date(request_kwargs['end_date'], today)
+        counter = _RequestCounter()
+
+        if shard_by == 'auto':
+            shard_by = self._choose_shard_size(request_kwargs, (end - start).days + 1, counter)
+
+        shards = _split_date_range(start, end, shard_by)
+        logger.info(f"Fetching {start} to {end} as {len(shards)} {shard_by} shard(s)")
+
+        def fetch_shard(shard: Tuple[date, date]) -> pd.DataFrame:
+            shard_kwargs = {
+                **request_kwargs,
+                "start_date": shard[0].isoformat(),
+                "end_date": shard[1].isoformat()
+            }
+            all_rows = []
+            metric_types = []
+            for offset, response in self._iter_pages(shard_kwargs, counter):
+                if offset == 0:
+                    metric_types = self._get_metric_types(response)
+                all_rows.extend(response.rows)
+            return self._convert_to_dataframe(all_rows, dimensions, metrics, metric_types)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as executor:
+            futures = [_submit_in_context(executor, fetch_shard, shard) for shard in shards]
+            # Futures are consumed in submission order, i.e. chronologically
+            df = pd.concat([future.result() for future in futures], ignore_index=True)
+
+        self.last_request_count = counter.value
+        logger.info(f"Merged {len(df)} rows from {len(shards)} shard(s) in {counter.value} request(s)")
+
+        # Shards are chronological; restore the requested order if it doesn't lead with date
+        order_bys = [name for name in request_kwargs.get('order_bys') or dimensions if name in df.columns]
+        if order_bys and order_bys[0] != 'date':
+            df = df.sort_values(order_bys, kind='stable', ignore_index=True)
+
+        # Encode after merging so all shards share the same categories
+        for dimension in dimensions:
+            if self._use_categorical(dimension, df[dimension], categorical_dimensions):
+                df[dimension] = df[dimension].astype('category')
+
+        if convert_date_columns:
+            df = self._convert_date_columns(df)
+
+        return df
+
+    def _choose_shard_size(
+            self,
+            request_kwargs: Dict[str, Any],
+            days: int,
+            counter: Optional[_RequestCounter] = None
+    ) -> str:
+        """
+        Pick the largest shard size expected to fit in a single page.
+
+        A one-row probe request over the whole range returns the total row
+        count, from which the average number of rows per day is estimated.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            days: Number of days in the range
+            counter: Optional counter of requests issued for the current report
+
+        Returns:
+            'month', 'week' or 'day'
+        """
+        probe = self._create_request(**request_kwargs, offset=0, limit=1)
+        response = self._call_with_retry(
+            lambda: self.client.run_report(probe),
+            "for shard size probe",
+            counter
+        )
+        self.quota_tracker.update(response)
+
+        rows_per_day = response.row_count / max(days, 1)
+        if rows_per_day * 31 <= self.MAX_ROWS_PER_REQUEST:
+            shard_by = 'month'
+        elif rows_per_day * 7 <= self.MAX_ROWS_PER_REQUEST:
+            shard_by = 'week'
+        else:
+            shard_by = 'day'
+
+        logger.info(f"Probe found {response.row_count} rows (~{rows_per_day:.0f}/day), sharding by {shard_by}")
+        return shard_by
+
+    def iter_report(
+            self,
+            start_date: str,
+            end_date: str,
+            dimensions: Optional[List[str]] = None,
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            convert_date_columns: bool = True,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a GA4 report as one pandas DataFrame per API page.
+
+        Each page is converted as soon as it arrives and released afterwards,
+        so memory stays bounded by a few pages regardless of report size.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format or 'today'
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals:
+                a list of names, 'all', 'auto' or None
+
+        Yields:
+            pandas DataFrame for each page of the report, in offset order
+        """
+        dimensions = dimensions or []
+        metrics = metrics or []
+        request_kwargs = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "dimensions_filter": dimensions_filter,
+            "order_bys": order_bys
+        }
+        counter = _RequestCounter()
+
+        self._validate_report(dimensions, metrics, dimensions_filter, order_bys)
+
+        logger.info(f"Streaming report with {len(dimensions)} dimensions and {len(metrics)} metrics")
+
+        for _, df in self._iter_converted_pages(
+                request_kwargs, convert_date_columns, categorical_dimensions, counter
+        ):
+            yield df
+
+        self.last_request_count = counter.value
+
+    def _iter_converted_pages(
+            self,
+            request_kwargs: Dict[str, Any],
+            convert_date_columns: bool,
+            categorical_dimensions: Optional[Union[str, List[str]]],
+            counter: Optional[_RequestCounter] = None,
+            checkpoint: Optional[_PageCheckpoint] = None
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Yield each page of a report as a DataFrame, releasing the raw page.
+
+        Args:
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals
+            counter: Optional counter of requests issued for the current report
+            checkpoint: Optional staging directory of a resumable report
+
+        Yields:
+            Tuples of (offset, DataFrame of the page)
+        """
+        for offset, response in self._iter_pages(request_kwargs, counter, checkpoint):
+            df = self._convert_to_dataframe(
+                response.rows,
+                request_kwargs['dimensions'],
+                request_kwargs['metrics'],
+                self._get_metric_types(response),
+                categorical_dimensions
+            )
+            del response
+            categorical_dimensions = self._pin_categorical_dimensions(
+                df, request_kwargs['dimensions'], categorical_dimensions
+            )
+
+            if convert_date_columns:
+                df = self._convert_date_columns(df)
+
+            yield offset, df
+
+    def get_reports(self, report_specs: List[Dict[str, Any]]) -> List[pd.DataFrame]:
+        """
+        Get several GA4 reports using batched API calls.
+
+        Requests are grouped into batchRunReports calls of up to
+        MAX_REPORTS_PER_BATCH reports. First pages of all reports are fetched
+        first; follow-up pages of large reports are then batched together in
+        a second round. Batches run concurrently on up to ``max_workers``
+        threads.
+
+        Args:
+            report_specs: List of dictionaries of get_report keyword arguments
+                (start_date, end_date, dimensions, metrics, dimensions_filter,
+                order_bys, convert_date_columns, categorical_dimensions)
+
+        Returns:
+            List of pandas DataFrames, one per report spec, in the same order
+
+        Raises:
+            ValueError: If validation is enabled and a spec is invalid
+        """
+        specs = [self._split_report_spec(spec) for spec in report_specs]
+        counter = _RequestCounter()
+
+        # Fail the whole batch before any report is fetched
+        for request_kwargs, _ in specs:
+            self._validate_report(
+                request_kwargs['dimensions'],
+                request_kwargs['metrics'],
+                request_kwargs['dimensions_filter'],
+                request_kwargs['order_bys']
+            )
+        pages: List[Dict[int, RunReportResponse]] = [{} for _ in specs]
+
+        logger.info(f"Generating {len(specs)} report(s) with batched requests")
+
+        pending = [(index, 0) for index in range(len(specs))]
+        while pending:
+            responses = self._run_batched_requests(
+                [self._create_page_request(specs[index][0], offset) for index, offset in pending],
+                counter
+            )
+
+            follow_ups = []
+            for (index, offset), response in zip(pending, responses):
+                pages[index][offset] = response
+                row_count = response.row_count
+                if offset == 0 and not self._is_last_page(0, len(response.rows), row_count):
+                    follow_ups.extend(
+                        (index, page_offset)
+                        for page_offset in range(self.MAX_ROWS_PER_REQUEST, row_count, self.MAX_ROWS_PER_REQUEST)
+                    )
+            pending = follow_ups
+
+        self.last_request_count = counter.value
+        logger.info(f"Fetched {len(specs)} report(s) in {counter.value} request(s)")
+
+        dataframes = []
+        for (request_kwargs, conversion_options), report_pages in zip(specs, pages):
+            all_rows = []
+            for offset in sorted(report_pages):
+                all_rows.extend(report_pages[offset].rows)
+
+            df = self._convert_to_dataframe(
+                all_rows,
+                request_kwargs['dimensions'],
+                request_kwargs['metrics'],
+                self._get_metric_types(report_pages[0]),
+                conversion_options['categorical_dimensions']
+            )
+            if conversion_options['convert_date_columns']:
+                df = self._convert_date_columns(df)
+
+            dataframes.append(df)
+
+        return dataframes
+
+    def _run_batched_requests(
+            self,
+            requests: List[RunReportRequest],
+            counter: Optional[_RequestCounter] = None
+    ) -> List[RunReportResponse]:
+        """
+        Run requests through batchRunReports, serving cached pages locally.
+
+        Args:
+            requests: RunReportRequest objects for the same property
+            counter: Optional counter of API requests issued
+
+        Returns:
+            List of RunReportResponse objects, in the same order as requests
+        """
+        from google.analytics.data_v1beta.types import BatchRunReportsRequest
+
+        responses: List[Optional[RunReportResponse]] = [None] * len(requests)
+
+        if self.cache is not None:
+            for i, request in enumerate(requests):
+                responses[i] = self.cache.get(request)
+
+        uncached = [i for i, response in enumerate(responses) if response is None]
+        batches = [
+            uncached[start:start + self.MAX_REPORTS_PER_BATCH]
+            for start in range(0, len(uncached), self.MAX_REPORTS_PER_BATCH)
+        ]
+
+        retry_budget = self.retry_policy.new_budget()
+
+        def run_batch(batch: List[int]) -> List[RunReportResponse]:
+            batch_request = BatchRunReportsRequest(
+                property=f"properties/{self.property_id}",
+                requests=[requests[i] for i in batch]
+            )
+            batch_response = self._call_with_retry(
+                lambda: self.client.batch_run_reports(batch_request),
+                f"for batch of {len(batch)} report(s)",
+                counter,
+                retry_budget
+            )
+
+            reports = list(batch_response.reports)
+            for report in reports:
+                self.quota_tracker.update(report)
+            return reports
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                futures = [_submit_in_context(executor, run_batch, batch) for batch in batches]
+                for batch, reports in zip(batches, (future.result() for future in futures)):
+                    for i, response in zip(batch, reports):
+                        responses[i] = response
+                        if self.cache is not None:
+                            self.cache.put(requests[i], response)
+
+        return responses
+
+    def get_multi_property_report(
+            self,
+            property_ids: List[str],
+            max_concurrency: int = 8,
+            per_property_concurrency: int = 2,
+            **report_kwargs: Any
+    ) -> pd.DataFrame:
+        """
+        Run the same report across several GA4 properties.
+
+        Args:
+            property_ids: GA4 property IDs to query
+            max_concurrency: Maximum API requests in flight across all properties
+            per_property_concurrency: Maximum API requests in flight per property
+            **report_kwargs: Keyword arguments for get_report
+
+        Returns:
+            pandas DataFrame with a leading 'property_id' column, with the
+            properties in the order given
+
+        Raises:
+            ValueError: If property_ids contains duplicates
+        """
+        import pandas as pd
+
+        results = dict(self.iter_multi_property_reports(
+            property_ids, max_concurrency, per_property_concurrency, **report_kwargs
+        ))
+
+        frames = []
+        for property_id in property_ids:
+            df = results.pop(property_id)
+            df.insert(0, 'property_id', property_id)
+            frames.append(df)
+
+        return pd.concat(frames, ignore_index=True)
+
+    def iter_multi_property_reports(
+            self,
+            property_ids: List[str],
+            max_concurrency: int = 8,
+            per_property_concurrency: int = 2,
+            **report_kwargs: Any
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Run the same report across several GA4 properties, streaming results.
+
+        All properties share this client's transport and credentials. Each
+        property gets its own quota tracker, since GA4 quotas are per
+        property, while a shared semaphore caps requests in flight overall.
+
+        Args:
+            property_ids: GA4 property IDs to query
+            max_concurrency: Maximum API requests in flight across all properties
+            per_property_concurrency: Maximum API requests in flight per property
+            **report_kwargs: Keyword arguments for get_report
+
+        Yields:
+            Tuples of (property_id, DataFrame) in completion order
+
+        Raises:
+            ValueError: If property_ids contains duplicates, or validation is
+                enabled and the spec is invalid for a property
+            RuntimeError: If the report fails for a property
+        """
+        duplicates = sorted({property_id for property_id in property_ids if property_ids.count(property_id) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate property IDs: {duplicates}")
+
+        transport_client = self.client
+        request_slots = threading.BoundedSemaphore(max_concurrency)
+
+        # Validate every property before fanning out, so a bad spec fails fast
+        for property_id in property_ids:
+            self._validate_report(
+                report_kwargs.get('dimensions') or [],
+                report_kwargs.get('metrics') or [],
+                report_kwargs.get('dimensions_filter'),
+                report_kwargs.get('order_bys'),
+                property_id=property_id
+            )
+
+        logger.info(f"Running report across {len(property_ids)} properties")
+
+        def run(property_id: str) -> Tuple[str, pd.DataFrame]:
+            client = GA4AnalyticsClient(
+                credentials_path=self.credentials_path,
+                property_id=property_id,
+                max_workers=per_property_concurrency,
+                cache=self.cache,
+                quota_tracker=QuotaTracker(per_property_concurrency),
+                retry_policy=self.retry_policy,
+                instrumentation=self.instrumentation,
+                validate=self.validate
+            )
+            client._client = transport_client
+            client._request_slots = request_slots
+
+            try:
+                return property_id, client.get_report(**report_kwargs)
+            except Exception as e:
+                logger.error(f"Report for property {property_id} failed: {e}")
+                raise RuntimeError(f"Report for property {property_id} failed: {e}") from e
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [_submit_in_context(executor, run, property_id) for property_id in property_ids]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def sync_report(
+            self,
+            store_dir: str,
+            start_date: str,
+            end_date: str,
+            dimensions: List[str],
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            convert_date_columns: bool = True,
+            freshness_days: int = ResponseCache.DEFAULT_FRESHNESS_DAYS
+    ) -> pd.DataFrame:
+        """
+        Incrementally sync a date-partitioned report into a local store.
+
+        Each day of the report is kept as its own Parquet partition under
+        ``store_dir``, so column dtypes survive a round trip. Only days
+        without a partition, or days still inside GA4's data-freshness window,
+        are queried; contiguous days are fetched together in a single report.
+        The requested range is then assembled from the stored partitions.
+
+        Args:
+            store_dir: Directory holding the per-day partitions
+            start_date: Start date in YYYY-MM-DD format or a relative date
+            end_date: End date in YYYY-MM-DD format or a relative date
+            dimensions: List of dimension names, must include 'date'
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            convert_date_columns: Whether to convert date columns to datetime
+            freshness_days: Days before today that are always re-fetched
+
+        Returns:
+            pandas DataFrame with the report data for the whole range
+
+        Raises:
+            ValueError: If 'date' is not among the dimensions
+        """
+        import pandas as pd
+
+        if 'date' not in dimensions:
+            raise ValueError("sync_report requires 'date' among the dimensions")
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("sync_report requires pyarrow: pip install pyarrow") from e
+
+        metrics = metrics or []
+        today = date.today()
+        start = _resolve_date(start_date, today)
+        end = _resolve_date(end_date, today)
+        freshness_cutoff = today - timedelta(days=freshness_days)
+
+        # Partitions are scoped to the report spec so different reports never mix
+        spec = json.dumps({
+            "property": self.property_id,
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "dimensions_filter": dimensions_filter,
+            "order_bys": order_bys
+        }, sort_keys=True, default=str)
+        partition_dir = Path(store_dir) / hashlib.sha256(spec.encode()).hexdigest()[:16]
+        partition_dir.mkdir(parents=True, exist_ok=True)
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        stale_days = [
+            day for day in days
+            if day >= freshness_cutoff or not self._partition_path(partition_dir, day).exists()
+        ]
+
+        logger.info(
+            f"Syncing {len(stale_days)} of {len(days)} day(s) from {start} to {end} "
+            f"into {partition_dir}"
+        )
+
+        for range_start, range_end in _contiguous_ranges(stale_days):
+            df = self.get_report(
+                start_date=range_start.isoformat(),
+                end_date=range_end.isoformat(),
+                dimensions=dimensions,
+                metrics=metrics,
+                dimensions_filter=dimensions_filter,
+                order_bys=order_bys,
+                convert_date_columns=False
+            )
+
+            day = range_start
+            while day <= range_end:
+                partition = df[df['date'] == day.strftime('%Y%m%d')].reset_index(drop=True)
+                self._write_partition(partition_dir, day, partition)
+                day += timedelta(days=1)
+
+        df = pd.concat(
+            [pd.read_parquet(self._partition_path(partition_dir, day)) for day in days],
+            ignore_index=True
+        )
+        logger.info(f"Assembled {len(df)} rows from {len(days)} partition(s)")
+
+        if convert_date_columns:
+            df = self._convert_date_columns(df)
+
+        return df
+
+    def _partition_path(self, partition_dir: Path, day: date) -> Path:
+        return partition_dir / f"date={day.isoformat()}.parquet"
+
+    def _write_partition(self, partition_dir: Path, day: date, df: pd.DataFrame) -> None:
+        """
+        Atomically write a single day partition.
+
+        Args:
+            partition_dir: Directory holding the partitions of a report
+            day: Day the partition covers
+            df: Rows of that day
+        """
+        path = self._partition_path(partition_dir, day)
+        tmp_path = _staging_path(str(path))
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def export_report(
+            self,
+            output_path: str,
+            start_date: str,
+            end_date: str,
+            dimensions: Optional[List[str]] = None,
+            metrics: Optional[List[str]] = None,
+            dimensions_filter: Optional[Dict[str, Any]] = None,
+            order_bys: Optional[List[str]] = None,
+            convert_date_columns: bool = True,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None,
+            checkpoint_dir: Optional[str] = None,
+            file_format: Optional[str] = None,
+            compression: str = 'zstd',
+            partition_by: Optional[str] = None
+    ) -> None:
+        """
+        Generate and export a GA4 report to CSV or Parquet.
+
+        Pages are converted and appended to the output file as they arrive,
+        so memory stays flat and the first rows hit the disk after a single
+        page. CSV files get the header written once; Parquet files get one
+        row group per page, typed metric columns and dictionary-encoded
+        dimensions. With ``partition_by`` the output is a Hive-style
+        partitioned dataset, e.g. ``date=YYYY-MM-DD/part-*.parquet``.
+
+        Args:
+            output_path: Path where to save the exported file, or the dataset
+                root directory when partition_by is given
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format or 'today'
+            dimensions: List of dimension names
+            metrics: List of metric names
+            dimensions_filter: Dictionary of dimension filters
+            order_bys: List of dimensions/metrics to order by
+            convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals:
+                a list of names, 'all', 'auto' or None
+            checkpoint_dir: Optional directory where fetched pages are staged;
+                re-running the same export resumes from the last completed page
+            file_format: 'csv' or 'parquet'; inferred from the output_path
+                extension when not given
+            compression: Parquet compression codec, e.g. 'zstd' or 'snappy'
+            partition_by: Optional column (typically 'date') to partition the
+                output by; partitioned exports default to Parquet
 
+        Raises:
+            ValueError: If file_format is unsupported or partition_by is not
+                among the dimensions
+        """
+        if partition_by and not file_format:
+            file_format = 'parquet'
+        file_format = file_format or ('parquet' if Path(output_path).suffix == '.parquet' else 'csv')
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"file_format must be 'csv' or 'parquet', got '{file_format}'")
+        if partition_by and partition_by not in (dimensions or []):
+            raise ValueError(f"partition_by '{partition_by}' must be one of the dimensions")
 
-class GA4AnalyticsClient:
-    """
-    A client class for interacting with Google Analytics 4 Reporting API.
+        # Ensure output directory exists
+        output_dir = Path(output_path) if partition_by else Path(output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    This class provides methods to establish connection, create requests,
-    run paginated queries, and convert responses to pandas DataFrames.
-    """
+        if checkpoint_dir:
+            # Pin relative dates so every page of a resumable export covers the same days
+            start_date = _resolve_date(start_date).isoformat()
+            end_date = _resolve_date(end_date).isoformat()
+
+        request_kwargs = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "dimensions": dimensions or [],
+            "metrics": metrics or [],
+            "dimensions_filter": dimensions_filter,
+            "order_bys": order_bys
+        }
+        counter = _RequestCounter()
+        checkpoint = self._open_checkpoint(request_kwargs, checkpoint_dir) if checkpoint_dir else None
+        rows_written = 0
 
-    MAX_ROWS_PER_REQUEST = 250000
+        self._validate_report(request_kwargs['dimensions'], request_kwargs['metrics'], dimensions_filter, order_bys)
 
-    def __init__(
-            self,
-            credentials_path: Optional[str] = None,
-            property_id: Optional[str] = None
-    ):
-        """
-        Initialize the GA4 Analytics Client.
+        if partition_by:
+            writer = _PartitionedPageWriter(
+                output_path, partition_by, file_format, request_kwargs['dimensions'], compression
+            )
+        elif file_format == 'parquet':
+            writer = _ParquetPageWriter(output_path, request_kwargs['dimensions'], compression)
+        else:
+            writer = _CsvPageWriter(output_path)
+
+        with _start_span("ga4.export_report", {
+            "ga4.property_id": self.property_id,
+            "ga4.export.path": output_path,
+            "ga4.export.format": file_format
+        }) as span:
+            # Stream pages to the output file
+            started = time.perf_counter()
+            try:
+                for _, df in self._iter_converted_pages(
+                        request_kwargs, convert_date_columns, categorical_dimensions, counter, checkpoint
+                ):
+                    write_started = time.perf_counter()
+                    writer.write(df)
+                    rows_written += len(df)
+                    if self.instrumentation is not None:
+                        self.instrumentation.on_write(file_format, len(df), time.perf_counter() - write_started)
+            except BaseException:
+                writer.close(completed=False)
+                raise
+            writer.close()
+
+            self.last_request_count = counter.value
+            if self.instrumentation is not None:
+                self.instrumentation.on_export(file_format, rows_written, time.perf_counter() - started)
+
+            if checkpoint is not None:
+                checkpoint.clear()
+
+            logger.info(f"Report with {rows_written} rows exported to: {output_path}")
+            span.set_attribute("ga4.rows", rows_written)
+            span.set_attribute("ga4.request_count", counter.value)
+
+
+class AsyncGA4AnalyticsClient(_BaseGA4Client):
+    """
+    An asyncio client for the Google Analytics 4 Reporting API.
 
-        Args:
-            credentials_path: Path to service account credentials JSON file
-            property_id: GA4 property ID
-        """
-        self.credentials_path = credentials_path or os.getenv('GA4_CREDENTIALS_PATH')
-        self.property_id = property_id or os.getenv('GA4_PROPERTY_ID')
-        self._client: Optional[BetaAnalyticsDataClient] = None
+    Request construction and DataFrame conversion are shared with
+    GA4AnalyticsClient, but requests go through BetaAnalyticsDataAsyncClient
+    and report pages are fetched concurrently as asyncio tasks, so a single
+    event loop can serve many reports at once.
+    """
 
     @property
-    def client(self) -> BetaAnalyticsDataClient:
+    def client(self) -> BetaAnalyticsDataAsyncClient:
         """
-        Lazy initialization of the GA4 client.
+        Lazy initialization of the async GA4 client.
 
         Returns:
-            BetaAnalyticsDataClient: Authenticated client instance
+            BetaAnalyticsDataAsyncClient: Authenticated client instance
         """
         if self._client is None:
             self._client = self._establish_connection()
         return self._client
 
-    def _establish_connection(self) -> BetaAnalyticsDataClient:
+    def _establish_connection(self) -> BetaAnalyticsDataAsyncClient:
         """
         Establish connection to GA4 API using service account credentials.
 
         Returns:
-            BetaAnalyticsDataClient: Authenticated client
+            BetaAnalyticsDataAsyncClient: Authenticated client
 
         Raises:
             RuntimeError: If connection establishment fails
         """
+        from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
+        from google.oauth2 import service_account
+
         try:
+            if self.transport is not None:
+                return BetaAnalyticsDataAsyncClient(transport=self.transport)
+
             credentials = service_account.Credentials.from_service_account_file(
                 self.credentials_path
             )
-            client = BetaAnalyticsDataClient(credentials=credentials)
-            logger.info("Successfully established connection to GA4 API")
+            client = BetaAnalyticsDataAsyncClient(credentials=credentials)
+            logger.info("Successfully established async connection to GA4 API")
             return client
         except Exception as e:
             logger.error(f"Failed to establish connection: {e}")
             raise RuntimeError(f"Failed to establish GA4 API connection: {e}")
 
-    def _create_filter_expressions(self, dimensions_filter: Dict[str, Any]) -> List[FilterExpression]:
+    async def _call_with_retry(
+            self,
+            call: Callable[[], Awaitable[Any]],
+            description: str,
+            counter: Optional[_RequestCounter] = None,
+            retry_budget: Optional[_RetryBudget] = None
+    ) -> Any:
         """
-        Create filter expressions based on dimension filters.
+        Await an API call within the quota, retrying transient errors.
 
         Args:
-            dimensions_filter: Dictionary mapping dimension names to filter values
+            call: Function returning the awaitable API call
+            description: Description of the call used in log and error messages
+            counter: Optional counter of requests issued for the current report
+            retry_budget: Optional retry budget shared by the pages of the report
 
         Returns:
-            List of FilterExpression objects
+            Result of the API call
+
+        Raises:
+            RuntimeError: If the call fails with a fatal error or retries run out
         """
-        filter_expressions = []
+        attempt = 0
+        while True:
+            if counter is not None:
+                counter.increment()
 
-        for dimension, values in dimensions_filter.items():
-            if isinstance(values, list):
-                # Use "in list" filter for multiple values
-                filter_expressions.append(
-                    FilterExpression(
-                        filter=Filter(
-                            field_name=dimension,
-                            in_list_filter=Filter.InListFilter(values=values)
-                        )
-                    )
-                )
-            elif isinstance(values, str):
-                # Use "contains" filter for single string value
-                filter_expressions.append(
-                    FilterExpression(
-                        filter=Filter(
-                            field_name=dimension,
-                            string_filter=Filter.StringFilter(
-                                match_type=Filter.StringFilter.MatchType.CONTAINS,
-                                value=values
-                            )
-                        )
-                    )
+            await self.quota_tracker.acquire_async()
+            try:
+                return await call()
+            except Exception as e:
+                if not self.retry_policy.should_retry(e, attempt, retry_budget):
+                    logger.error(f"Failed to run request {description}: {e}")
+                    raise RuntimeError(f"API request failed {description}: {e}")
+                delay = self.retry_policy.delay(attempt)
+                logger.warning(
+                    f"Retryable error {description} (attempt {attempt + 1}): {e}. "
+                    f"Retrying in {delay:.1f}s"
                 )
+            finally:
+                self.quota_tracker.release_async()
 
-        return filter_expressions
+            await asyncio.sleep(delay)
+            attempt += 1
 
-    def _create_request(
+    async def _validate_report(
             self,
-            start_date: str,
-            end_date: str,
-            dimensions: Optional[List[str]] = None,
-            metrics: Optional[List[str]] = None,
+            dimensions: List[str],
+            metrics: List[str],
             dimensions_filter: Optional[Dict[str, Any]] = None,
             order_bys: Optional[List[str]] = None,
-            offset: int = 0,
-            limit: int = None
-    ) -> RunReportRequest:
+            property_id: Optional[str] = None
+    ) -> None:
         """
-        Create a RunReportRequest object.
+        Validate a report spec before any page is requested.
+
+        Does nothing unless ``validate`` is set. Property metadata and
+        compatibility answers come from ``metadata_cache`` when available, so
+        repeated specs are validated without API calls.
 
         Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format or 'today'
             dimensions: List of dimension names
             metrics: List of metric names
             dimensions_filter: Dictionary of dimension filters
             order_bys: List of dimensions/metrics to order by
-            offset: Starting row offset
-            limit: Maximum rows to return
+            property_id: Property to validate against; this client's by default
 
-        Returns:
-            RunReportRequest object
+        Raises:
+            ValueError: If the spec uses unknown or incompatible names
+            RuntimeError: If the metadata or compatibility request fails
         """
-        dimensions = dimensions or []
-        metrics = metrics or []
-        limit = limit or self.MAX_ROWS_PER_REQUEST
-
-        request_dict = {
-            "property": f"properties/{self.property_id}",
-            "date_ranges": [{"start_date": start_date, "end_date": end_date}],
-            "dimensions": [{"name": dim} for dim in dimensions],
-            "metrics": [{"name": metric} for metric in metrics],
-            "keep_empty_rows": True,
-            "offset": offset,
-            "limit": limit
-        }
-
-        # Apply dimension filters if provided
-        if dimensions_filter:
-            request_dict["dimension_filter"] = FilterExpression(
-                or_group=FilterExpressionList(
-                    expressions=self._create_filter_expressions(dimensions_filter)
-                )
+        if self.validate is None:
+            return
+
+        property_id = property_id or self.property_id
+        names = metadata_cache.get_names(property_id)
+        if names is None:
+            metadata = await self._call_with_retry(
+                lambda: self.client.get_metadata(name=f"properties/{property_id}/metadata"),
+                f"for metadata of property {property_id}"
             )
+            names = self._metadata_names(metadata)
+            metadata_cache.put_names(property_id, names)
 
-        # Apply ordering
-        if not order_bys and dimensions:
-            order_bys = dimensions  # Default to ordering by dimensions
+        self._check_names(property_id, names, dimensions, metrics, dimensions_filter, order_bys)
 
-        if order_bys:
-            request_dict["order_bys"] = [
-                OrderBy(dimension={"dimension_name": order_by})
-                for order_by in order_bys
-            ]
+        if self.validate != 'compatibility':
+            return
 
-        return RunReportRequest(**request_dict)
+        key = self._compatibility_key(property_id, dimensions, metrics, dimensions_filter)
+        incompatible = metadata_cache.get_incompatible(key)
+        if incompatible is None:
+            request = self._create_compatibility_request(key)
+            response = await self._call_with_retry(
+                lambda: self.client.check_compatibility(request),
+                f"for compatibility check of property {property_id}"
+            )
+            incompatible = self._incompatible_names(response)
+            metadata_cache.put_incompatible(key, incompatible)
 
-    def _run_paginated_request(
+        self._check_compatible(property_id, incompatible)
+
+    async def _fetch_page(
             self,
-            start_date: str,
-            end_date: str,
-            dimensions: Optional[List[str]] = None,
-            metrics: Optional[List[str]] = None,
-            dimensions_filter: Optional[Dict[str, Any]] = None,
-            order_bys: Optional[List[str]] = None
-    ) -> List[Any]:
+            request_kwargs: Dict[str, Any],
+            offset: int,
+            counter: Optional[_RequestCounter] = None,
+            retry_budget: Optional[_RetryBudget] = None
+    ) -> RunReportResponse:
         """
-        Execute paginated requests to fetch all data.
+        Fetch a single page of a report, consulting the response cache first.
+
+        Transient errors are retried according to ``retry_policy``.
 
         Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format or 'today'
-            dimensions: List of dimension names
-            metrics: List of metric names
-            dimensions_filter: Dictionary of dimension filters
-            order_bys: List of dimensions/metrics to order by
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            offset: Starting row offset of the page
+            counter: Optional counter of requests issued for the current report
+            retry_budget: Optional retry budget shared by the pages of the report
 
         Returns:
-            List of all rows from paginated requests
-        """
-        all_rows = []
-        offset = 0
+            RunReportResponse for the requested page
 
-        logger.info(f"Starting paginated request for date range: {start_date} to {end_date}")
-
-        while True:
-            request = self._create_request(
-                start_date=start_date,
-                end_date=end_date,
-                dimensions=dimensions,
-                metrics=metrics,
-                dimensions_filter=dimensions_filter,
-                order_bys=order_bys,
-                offset=offset,
-                limit=self.MAX_ROWS_PER_REQUEST
+        Raises:
+            RuntimeError: If the API request fails
+        """
+        request = self._create_page_request(request_kwargs, offset)
+
+        if self.cache is not None:
+            cached = self.cache.get(request)
+            if cached is not None:
+                logger.info(f"Cache hit for offset {offset}")
+                return cached
+
+        with _start_span("ga4.run_report", {"ga4.property_id": self.property_id, "ga4.offset": offset}) as span:
+            started = time.perf_counter()
+            response = await self._call_with_retry(
+                lambda: self.client.run_report(request),
+                f"at offset {offset}",
+                counter,
+                retry_budget
             )
+            self._record_page(offset, response, time.perf_counter() - started)
+            self._annotate_page_span(span, request, response)
 
-            try:
-                response = self.client.run_report(request)
-
-                if not response.rows:
-                    logger.info(f"No more rows to fetch. Total rows collected: {len(all_rows)}")
-                    break
-
-                batch_size = len(response.rows)
-                all_rows.extend(response.rows)
-                offset += self.MAX_ROWS_PER_REQUEST
-
-                logger.info(f"Fetched {batch_size} rows (offset: {offset - self.MAX_ROWS_PER_REQUEST})")
+        # Pacing would block the event loop, so the async client only records quota
+        self.quota_tracker.update(response)
 
-            except Exception as e:
-                logger.error(f"Failed to run request at offset {offset}: {e}")
-                raise RuntimeError(f"API request failed at offset {offset}: {e}")
+        if self.cache is not None:
+            self.cache.put(request, response)
 
-        return all_rows
+        return response
 
-    def _convert_to_dataframe(
+    async def _iter_pages(
             self,
-            all_data: List[Any],
-            dimensions: List[str],
-            metrics: List[str]
-    ) -> pd.DataFrame:
+            request_kwargs: Dict[str, Any],
+            counter: Optional[_RequestCounter] = None
+    ) -> AsyncIterator[Tuple[int, RunReportResponse]]:
         """
-        Convert API response data to pandas DataFrame.
+        Yield report pages in offset order as they arrive.
+
+        Mirrors GA4AnalyticsClient._iter_pages, with at most ``max_workers``
+        pages in flight as asyncio tasks.
 
         Args:
-            all_data: List of row data from API response
-            dimensions: List of dimension names
-            metrics: List of metric names
+            request_kwargs: Keyword arguments for _create_request, without offset/limit
+            counter: Optional counter of requests issued for the current report
 
-        Returns:
-            pandas DataFrame with the data
+        Yields:
+            Tuples of (offset, RunReportResponse)
         """
-        try:
-            data = []
-            for row in all_data:
-                row_dict = {}
+        retry_budget = self.retry_policy.new_budget()
+        first_page = await self._fetch_page(request_kwargs, 0, counter, retry_budget)
+        row_count = first_page.row_count
+        is_last = self._is_last_page(0, len(first_page.rows), row_count)
 
-                # Add dimension values
-                for i, dimension in enumerate(dimensions):
-                    row_dict[dimension] = row.dimension_values[i].value
+        logger.info(f"Fetched {len(first_page.rows)} rows (offset: 0, total rows: {row_count})")
 
-                # Add metric values
-                for i, metric in enumerate(metrics):
-                    row_dict[metric] = row.metric_values[i].value
+        yield 0, first_page
+        del first_page
 
-                data.append(row_dict)
+        if is_last:
+            return
 
-            df = pd.DataFrame(data)
-            logger.info(f"Successfully converted {len(df)} rows to DataFrame")
-            return df
+        offsets = iter(range(self.MAX_ROWS_PER_REQUEST, row_count, self.MAX_ROWS_PER_REQUEST))
+        pending = deque()
 
-        except Exception as e:
-            logger.error(f"Failed to convert response to DataFrame: {e}")
-            raise RuntimeError(f"DataFrame conversion failed: {e}")
+        def submit_next() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                task = asyncio.create_task(self._fetch_page(request_kwargs, offset, counter, retry_budget))
+                pending.append((offset, task))
 
-    def get_report(
+        try:
+            for _ in range(self.max_workers):
+                submit_next()
+
+            # Await tasks in submission order so pages stay in offset order
+            while pending:
+                offset, task = pending.popleft()
+                response = await task
+                submit_next()
+
+                is_last = self._is_last_page(offset, len(response.rows), row_count)
+                logger.info(f"Fetched {len(response.rows)} rows (offset: {offset})")
+
+                yield offset, response
+                del response
+
+                if is_last:
+                    break
+        finally:
+            tasks = [task for _, task in pending]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_report(
             self,
             start_date: str,
             end_date: str,
@@ -292,11 +3369,15 @@ class GA4AnalyticsClient:
             metrics: Optional[List[str]] = None,
             dimensions_filter: Optional[Dict[str, Any]] = None,
             order_bys: Optional[List[str]] = None,
-            convert_date_columns: bool = True
+            convert_date_columns: bool = True,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None
     ) -> pd.DataFrame:
         """
         Get a complete GA4 report as a pandas DataFrame.
 
+        DataFrame conversion runs in a worker thread so it doesn't block the
+        event loop.
+
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format or 'today'
@@ -305,51 +3386,75 @@ class GA4AnalyticsClient:
             dimensions_filter: Dictionary of dimension filters
             order_bys: List of dimensions/metrics to order by
             convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals:
+                a list of names, 'all', 'auto' or None
 
         Returns:
             pandas DataFrame with the report data
         """
-        dimensions = dimensions or []
-        metrics = metrics or []
-
-        logger.info(f"Generating report with {len(dimensions)} dimensions and {len(metrics)} metrics")
+        with _start_span("ga4.get_report", {
+            "ga4.property_id": self.property_id,
+            "ga4.start_date": start_date,
+            "ga4.end_date": end_date,
+            "ga4.dimensions": dimensions or [],
+            "ga4.metrics": metrics or []
+        }) as span:
+            dimensions = dimensions or []
+            metrics = metrics or []
+            request_kwargs = {
+                "start_date": start_date,
+                "end_date": end_date,
+                "dimensions": dimensions,
+                "metrics": metrics,
+                "dimensions_filter": dimensions_filter,
+                "order_bys": order_bys
+            }
+            counter = _RequestCounter()
+            all_rows = []
+            metric_types = []
+
+            await self._validate_report(dimensions, metrics, dimensions_filter, order_bys)
+
+            logger.info(f"Generating report with {len(dimensions)} dimensions and {len(metrics)} metrics")
+
+            async for offset, response in self._iter_pages(request_kwargs, counter):
+                if offset == 0:
+                    metric_types = self._get_metric_types(response)
+                all_rows.extend(response.rows)
 
-        # Fetch all data using pagination
-        all_data = self._run_paginated_request(
-            start_date=start_date,
-            end_date=end_date,
-            dimensions=dimensions,
-            metrics=metrics,
-            dimensions_filter=dimensions_filter,
-            order_bys=order_bys
-        )
+            self.last_request_count = counter.value
 
-        # Convert to DataFrame
-        df = self._convert_to_dataframe(all_data, dimensions, metrics)
+            df = await asyncio.to_thread(
+                self._convert_to_dataframe,
+                all_rows,
+                dimensions,
+                metrics,
+                metric_types,
+                categorical_dimensions
+            )
 
-        # Convert date columns if requested
-        if convert_date_columns and 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], format='%Y%m%d')
-            logger.info("Converted 'date' column to datetime format")
+            if convert_date_columns:
+                df = self._convert_date_columns(df)
 
-        return df
+            span.set_attribute("ga4.rows", len(df))
+            span.set_attribute("ga4.request_count", self.last_request_count)
+            return df
 
-    def export_report(
+    async def iter_report(
             self,
-            output_path: str,
             start_date: str,
             end_date: str,
             dimensions: Optional[List[str]] = None,
             metrics: Optional[List[str]] = None,
             dimensions_filter: Optional[Dict[str, Any]] = None,
             order_bys: Optional[List[str]] = None,
-            convert_date_columns: bool = True
-    ) -> None:
+            convert_date_columns: bool = True,
+            categorical_dimensions: Optional[Union[str, List[str]]] = None
+    ) -> AsyncIterator[pd.DataFrame]:
         """
-        Generate and export a GA4 report to CSV.
+        Stream a GA4 report as one pandas DataFrame per API page.
 
         Args:
-            output_path: Path where to save the CSV file
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format or 'today'
             dimensions: List of dimension names
@@ -357,28 +3462,142 @@ class GA4AnalyticsClient:
             dimensions_filter: Dictionary of dimension filters
             order_bys: List of dimensions/metrics to order by
             convert_date_columns: Whether to convert date columns to datetime
+            categorical_dimensions: Dimensions to encode as pandas Categoricals:
+                a list of names, 'all', 'auto' or None
+
+        Yields:
+            pandas DataFrame for each page of the report, in offset order
         """
-        # Ensure output directory exists
-        output_dir = Path(output_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
+        dimensions = dimensions or []
+        metrics = metrics or []
+        request_kwargs = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "dimensions_filter": dimensions_filter,
+            "order_bys": order_bys
+        }
+        counter = _RequestCounter()
 
-        # Get the report
-        df = self.get_report(
-            start_date=start_date,
-            end_date=end_date,
-            dimensions=dimensions,
-            metrics=metrics,
-            dimensions_filter=dimensions_filter,
-            order_bys=order_bys,
-            convert_date_columns=convert_date_columns
-        )
+        await self._validate_report(dimensions, metrics, dimensions_filter, order_bys)
+
+        logger.info(f"Streaming report with {len(dimensions)} dimensions and {len(metrics)} metrics")
 
-        # Export to CSV
-        df.to_csv(output_path, index=False)
-        logger.info(f"Report exported to: {output_path}")
+        pages = self._iter_pages(request_kwargs, counter)
+        try:
+            async for _, response in pages:
+                df = await asyncio.to_thread(
+                    self._convert_to_dataframe,
+                    response.rows,
+                    dimensions,
+                    metrics,
+                    self._get_metric_types(response),
+                    categorical_dimensions
+                )
+                del response
+                categorical_dimensions = self._pin_categorical_dimensions(df, dimensions, categorical_dimensions)
+
+                if convert_date_columns:
+                    df = self._convert_date_columns(df)
+
+                yield df
+        finally:
+            # Async generators aren't closed when dropped, so cancel in-flight pages
+            # now if the caller stops early rather than when the loop shuts down
+            await pages.aclose()
+
+        self.last_request_count = counter.value
+
+
+class ReportScheduler:
+    """
+    Runs a queue of reports in priority order within the property quota.
+
+    Reports are submitted with a priority and executed by a pool of worker
+    threads, highest priority first. Every page request goes through the
+    client's QuotaTracker, so the scheduler keeps as many reports in flight
+    as the quota allows and pauses when the hourly budget runs low.
+    """
+
+    def __init__(self, client: GA4AnalyticsClient, max_concurrent_reports: int = 2):
+        """
+        Initialize the report scheduler.
+
+        Args:
+            client: Client used to run the reports
+            max_concurrent_reports: Maximum number of reports running at once
+        """
+        self.client = client
+        self.max_concurrent_reports = max_concurrent_reports
+        self._queue: List[Tuple[int, int, str, Dict[str, Any]]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, priority: int = 0, **report_kwargs: Any) -> None:
+        """
+        Queue a report.
+
+        Args:
+            name: Unique name the report result is returned under
+            priority: Higher priorities run first; ties run in submission order
+            **report_kwargs: Keyword arguments for GA4AnalyticsClient.get_report
+        """
+        with self._lock:
+            heapq.heappush(self._queue, (-priority, self._sequence, name, report_kwargs))
+            self._sequence += 1
+
+    def _next_report(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            if not self._queue:
+                return None
+            _, _, name, report_kwargs = heapq.heappop(self._queue)
+            return name, report_kwargs
+
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """
+        Run all queued reports.
+
+        Returns:
+            Dictionary mapping report names to DataFrames
+
+        Raises:
+            RuntimeError: If any report failed; the remaining reports still run
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        errors: Dict[str, Exception] = {}
+
+        def worker() -> None:
+            while True:
+                item = self._next_report()
+                if item is None:
+                    return
+
+                name, report_kwargs = item
+                logger.info(f"Running scheduled report '{name}'")
+                try:
+                    results[name] = self.client.get_report(**report_kwargs)
+                except Exception as e:
+                    logger.error(f"Scheduled report '{name}' failed: {e}")
+                    errors[name] = e
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_reports) as executor:
+            for _ in range(self.max_concurrent_reports):
+                _submit_in_context(executor, worker)
+
+        if errors:
+            raise RuntimeError(f"{len(errors)} scheduled report(s) failed: {sorted(errors)}")
+
+        return results
 
 
 def main():
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     try:
         # Initialize client
         client = GA4AnalyticsClient()
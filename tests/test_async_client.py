@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+import pandas as pd
+
+from ga4_app import AsyncGA4AnalyticsClient
+
+REPORT_ARGS = ("2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"])
+
+
+def make_async_client(server):
+    # The asyncio transport has to be created inside the running event loop
+    client = AsyncGA4AnalyticsClient(
+        credentials_path="unused", property_id="0", transport=server.create_async_transport()
+    )
+    client.MAX_ROWS_PER_REQUEST = 3000
+    return client
+
+
+def test_async_report_matches_sync_report(make_client, server):
+    expected = make_client().get_report(*REPORT_ARGS)
+    server.request_count = 0
+
+    async def run():
+        client = make_async_client(server)
+        return client, await client.get_report(*REPORT_ARGS)
+
+    client, df = asyncio.run(run())
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert client.last_request_count == 4
+    assert server.request_count == 4
+
+
+def test_async_iter_report_yields_pages_in_offset_order(server):
+    async def run():
+        client = make_async_client(server)
+        return [page async for page in client.iter_report(*REPORT_ARGS, convert_date_columns=False)]
+
+    pages = asyncio.run(run())
+
+    assert [len(page) for page in pages] == [3000, 3000, 3000, 1500]
+    assert server.request_count == 4
+
+
+def test_leaving_async_iter_report_early_cancels_pending_pages(server):
+    server.latency = 0.2
+
+    async def run():
+        client = make_async_client(server)
+        client.max_workers = 2
+        async with aclosing(client.iter_report(*REPORT_ARGS)) as pages:
+            # The last page is requested when the second one arrives, so it is still in flight
+            pages_read = 0
+            async for _ in pages:
+                pages_read += 1
+                if pages_read == 2:
+                    break
+        return [task for task in asyncio.all_tasks() if "_fetch_page" in task.get_coro().__qualname__]
+
+    assert asyncio.run(run()) == []
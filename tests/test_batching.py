@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+import pandas as pd
+
+from ga4_app import ResponseCache
+
+
+def make_spec(end_day):
+    return {
+        "start_date": "2025-06-01",
+        "end_date": f"2025-06-{end_day:02d}",
+        "dimensions": ["date", "deviceCategory"],
+        "metrics": ["sessions"]
+    }
+
+
+def test_first_pages_are_batched_five_reports_per_call(make_client, server):
+    server.row_count = 100
+    client = make_client()
+
+    dataframes = client.get_reports([make_spec(end_day) for end_day in range(1, 13)])
+
+    assert len(dataframes) == 12
+    assert client.last_request_count == 3
+    assert server.request_count == 3
+
+
+def test_follow_up_pages_are_batched_and_kept_in_order(make_client, server):
+    specs = [make_spec(10), make_spec(20)]
+    expected = [make_client().get_report(**spec) for spec in specs]
+    server.request_count = 0
+    client = make_client()
+
+    dataframes = client.get_reports(specs)
+
+    # One call for both first pages, then six follow-up pages in batches of five and one
+    assert client.last_request_count == 3
+    assert server.request_count == 3
+    for df, expected_df in zip(dataframes, expected):
+        pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test_cached_pages_are_not_requested_again(make_client, server, tmp_path):
+    specs = [make_spec(10), make_spec(20)]
+    first = make_client(cache=ResponseCache(str(tmp_path))).get_reports(specs)
+    requests_before = server.request_count
+    client = make_client(cache=ResponseCache(str(tmp_path)))
+
+    second = client.get_reports(specs)
+
+    assert server.request_count == requests_before
+    assert client.last_request_count == 0
+    for df, expected_df in zip(second, first):
+        pd.testing.assert_frame_equal(df, expected_df)
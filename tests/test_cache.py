@@ -0,0 +1,87 @@
+import os
+import time
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("google.analytics.data_v1beta")
+
+from google.analytics.data_v1beta.types import DateRange, Row, RunReportRequest, RunReportResponse
+
+from ga4_app import ResponseCache
+
+
+def make_request(start_date, end_date, offset=0):
+    return RunReportRequest(
+        property="properties/0", date_ranges=[DateRange(start_date=start_date, end_date=end_date)], offset=offset
+    )
+
+
+def make_response(row_count=1):
+    return RunReportResponse(row_count=row_count, rows=[Row() for _ in range(row_count)])
+
+
+def age_entry(cache, request, seconds):
+    path = cache._path(cache.fingerprint(request))
+    written_at = time.time() - seconds
+    os.utime(path, (written_at, written_at))
+
+
+def test_relative_dates_share_the_entry_of_their_resolved_dates(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    week_ago = (date.today() - timedelta(days=7)).isoformat()
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    cache.put(make_request("7daysAgo", "yesterday"), make_response(3))
+
+    assert cache.get(make_request(week_ago, yesterday)).row_count == 3
+    assert cache.fingerprint(make_request("yesterday", "yesterday")) != cache.fingerprint(
+        make_request("2025-06-01", "2025-06-01")
+    )
+
+
+def test_entry_expires_after_its_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path), absolute_ttl=60)
+    request = make_request("2025-06-01", "2025-06-30")
+    cache.put(request, make_response())
+
+    age_entry(cache, request, 30)
+    assert cache.get(request) is not None
+
+    age_entry(cache, request, 120)
+    assert cache.get(request) is None
+    assert not list(tmp_path.glob("*/*.pb"))
+
+
+def test_recent_ranges_use_the_relative_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path), relative_ttl=60, absolute_ttl=None)
+    closed = make_request("2025-06-01", "2025-06-30")
+    recent = make_request("7daysAgo", (date.today() - timedelta(days=1)).isoformat())
+    cache.put(closed, make_response())
+    cache.put(recent, make_response())
+
+    age_entry(cache, closed, 3600)
+    age_entry(cache, recent, 3600)
+
+    assert cache.get(closed) is not None
+    assert cache.get(recent) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    entry_bytes = len(RunReportResponse.serialize(make_response(10)))
+    # Room for three entries after eviction
+    max_bytes = int(3 * entry_bytes / ResponseCache.EVICTION_TARGET_RATIO) + 1
+    cache = ResponseCache(str(tmp_path), max_bytes=max_bytes)
+    requests = [make_request("2025-06-01", "2025-06-30", offset) for offset in range(3)]
+    for index, request in enumerate(requests):
+        cache.put(request, make_response(10))
+        age_entry(cache, request, 100 - index)
+
+    # Reading the oldest entry makes the second one the least recently used
+    assert cache.get(requests[0]) is not None
+    cache.put(make_request("2025-06-01", "2025-06-30", 3), make_response(10))
+
+    assert cache.get(requests[1]) is None
+    assert cache.get(requests[0]) is not None
+    assert cache.get(requests[2]) is not None
+    assert cache._total_bytes == 3 * entry_bytes
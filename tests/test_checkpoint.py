@@ -0,0 +1,58 @@
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+import pandas as pd
+
+from ga4_app import _PageCheckpoint
+
+REQUEST_KWARGS = {
+    "start_date": "2025-06-01",
+    "end_date": "2025-06-30",
+    "dimensions": ["date", "deviceCategory"],
+    "metrics": ["sessions"],
+    "dimensions_filter": None,
+    "order_bys": None
+}
+
+
+def test_failed_export_resumes_from_checkpoint(make_client, server, tmp_path):
+    client = make_client(fail_at_offset=6000)
+    output_path = tmp_path / "report.csv"
+    checkpoint_dir = tmp_path / "checkpoints"
+
+    with pytest.raises(RuntimeError):
+        client.export_report(str(output_path), "2025-06-01", "2025-06-30", ["date"], ["sessions"],
+                             checkpoint_dir=str(checkpoint_dir))
+    requests_before_resume = server.request_count
+
+    make_client().export_report(str(output_path), "2025-06-01", "2025-06-30", ["date"], ["sessions"],
+                                      checkpoint_dir=str(checkpoint_dir))
+
+    assert server.request_count - requests_before_resume == 2
+    assert len(pd.read_csv(output_path)) == 10500
+    assert list(checkpoint_dir.iterdir()) == []
+
+
+def test_checkpoint_key_uses_resolved_dates(make_client, tmp_path):
+    client = make_client()
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    relative = client._open_checkpoint({**REQUEST_KWARGS, "end_date": "yesterday"}, str(tmp_path))
+    resolved = client._open_checkpoint({**REQUEST_KWARGS, "end_date": yesterday}, str(tmp_path))
+
+    assert relative.directory == resolved.directory
+
+
+def test_stale_checkpoint_is_discarded(tmp_path):
+    checkpoint = _PageCheckpoint(str(tmp_path), "report")
+    checkpoint._manifest_path.write_text(json.dumps({
+        "created": (datetime.now() - timedelta(days=2)).isoformat(),
+        "completed_offsets": [0, 3000]
+    }))
+
+    assert _PageCheckpoint(str(tmp_path), "report").completed_offsets == set()
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+import pandas as pd
+
+
+@pytest.mark.parametrize("categorical_dimensions", ["all", "auto"])
+def test_date_stays_datetime_with_categorical_dimensions(make_client, categorical_dimensions):
+    df = make_client().get_report(
+        "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"],
+        categorical_dimensions=categorical_dimensions
+    )
+
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+    assert isinstance(df["deviceCategory"].dtype, pd.CategoricalDtype)
+
+
+def test_explicit_categorical_date_gets_datetime_categories(make_client):
+    df = make_client().get_report(
+        "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"],
+        categorical_dimensions=["date"]
+    )
+
+    assert isinstance(df["date"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df["date"].cat.categories)
+
+
+def test_auto_categorical_decision_is_kept_for_every_page(make_client, server):
+    # The 2-row last page alone would be too diverse for 'auto' to encode
+    server.row_count = 6002
+
+    pages = list(make_client().iter_report(
+        "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"],
+        categorical_dimensions="auto"
+    ))
+
+    assert len(pages[-1]) == 2
+    assert all(isinstance(page["deviceCategory"].dtype, pd.CategoricalDtype) for page in pages)
@@ -0,0 +1,118 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+import pandas as pd
+
+
+def export(client, output_path):
+    client.export_report(
+        str(output_path), "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"]
+    )
+
+
+def test_csv_export_writes_all_rows(make_client, tmp_path):
+    output_path = tmp_path / "report.csv"
+
+    export(make_client(), output_path)
+
+    assert len(pd.read_csv(output_path)) == 10500
+    assert [path.name for path in tmp_path.iterdir()] == ["report.csv"]
+
+
+def test_failed_csv_export_keeps_existing_file(make_client, tmp_path):
+    output_path = tmp_path / "report.csv"
+    output_path.write_text("previous export\n")
+
+    with pytest.raises(RuntimeError):
+        export(make_client(fail_at_offset=3000), output_path)
+
+    assert output_path.read_text() == "previous export\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["report.csv"]
+
+
+def test_parquet_export_writes_all_rows(make_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path / "report.parquet"
+
+    export(make_client(), output_path)
+
+    assert len(pd.read_parquet(output_path)) == 10500
+    assert [path.name for path in tmp_path.iterdir()] == ["report.parquet"]
+
+
+def test_failed_parquet_export_leaves_no_file(make_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path / "report.parquet"
+
+    with pytest.raises(RuntimeError):
+        export(make_client(fail_at_offset=3000), output_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_partitioned_export_writes_one_directory_per_day(make_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    client = make_client()
+
+    client.export_report(
+        str(tmp_path / "dataset"), "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"],
+        partition_by="date"
+    )
+
+    partitions = sorted(path.name for path in (tmp_path / "dataset").iterdir())
+    assert len(partitions) == 30
+    assert partitions[0] == "date=2025-06-01"
+    assert not list((tmp_path / "dataset").rglob("*.tmp"))
+    assert len(pd.read_parquet(tmp_path / "dataset")) == 10500
+
+
+def export_partitioned(client, dataset):
+    client.export_report(
+        str(dataset), "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"], partition_by="date"
+    )
+
+
+def test_failed_partitioned_reexport_keeps_previous_run(make_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    dataset = tmp_path / "dataset"
+    export_partitioned(make_client(), dataset)
+    previous_files = sorted(dataset.rglob("*"))
+
+    with pytest.raises(RuntimeError):
+        export_partitioned(make_client(fail_at_offset=3000), dataset)
+
+    assert sorted(dataset.rglob("*")) == previous_files
+    assert len(pd.read_parquet(dataset)) == 10500
+
+
+def test_partition_by_outside_dimensions_is_rejected_before_fetching(make_client, server, tmp_path):
+    with pytest.raises(ValueError, match="partition_by"):
+        make_client().export_report(
+            str(tmp_path / "dataset"), "2025-06-01", "2025-06-30", ["deviceCategory"], ["sessions"],
+            partition_by="date"
+        )
+
+    assert server.request_count == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("categorical_dimensions", ["auto", ["date", "deviceCategory"]])
+def test_parquet_export_types_follow_column_roles(make_client, server, tmp_path, categorical_dimensions):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    # A 2-row last page used to switch the column types mid-file
+    server.row_count = 6002
+    output_path = tmp_path / "report.parquet"
+
+    make_client().export_report(
+        str(output_path), "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"],
+        categorical_dimensions=categorical_dimensions
+    )
+
+    schema = pq.read_schema(output_path)
+    assert pa.types.is_timestamp(schema.field("date").type)
+    assert schema.field("deviceCategory").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("sessions").type == pa.int64()
+    assert len(pd.read_parquet(output_path)) == 6002
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+from ga4_app import RetryPolicy
+
+
+def test_get_report_paginates_through_fake_server(make_client, server):
+    client = make_client()
+
+    df = client.get_report(
+        "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions", "averageSessionDuration"]
+    )
+
+    assert len(df) == 10500
+    assert client.last_request_count == 4
+    assert server.request_count == 4
+    assert list(df.columns) == ["date", "deviceCategory", "sessions", "averageSessionDuration"]
+    assert df["sessions"].dtype == "int64"
+    assert df["averageSessionDuration"].dtype == "float64"
+
+
+def test_get_report_retries_injected_errors(make_client, server):
+    server.error_rate = 0.3
+    client = make_client(retry_policy=RetryPolicy(initial_delay=0.01, max_delay=0.01, max_attempts=10))
+
+    df = client.get_report("2025-06-01", "2025-06-30", ["date"], ["sessions"])
+
+    assert len(df) == 10500
+    assert server.request_count >= 4
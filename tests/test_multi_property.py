@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+ROW_COUNT = 500
+
+
+def test_exhausted_daily_quota_releases_shared_slot(make_client):
+    client = make_client()
+    client._request_slots = threading.BoundedSemaphore(1)
+    client.quota_tracker.tokens_per_day = 0
+
+    with pytest.raises(RuntimeError, match="Daily token quota exhausted"):
+        client._call_with_retry(lambda: None, "in test")
+
+    assert client._request_slots.acquire(blocking=False)
+
+
+def test_multi_property_report_concatenates_properties(make_client):
+    client = make_client()
+
+    df = client.get_multi_property_report(
+        ["1", "2", "3"], start_date="2025-06-01", end_date="2025-06-07",
+        dimensions=["date"], metrics=["sessions"]
+    )
+
+    assert len(df) == 1500
+    assert list(df["property_id"].unique()) == ["1", "2", "3"]
+
+
+def test_multi_property_report_rejects_duplicate_properties(make_client):
+    client = make_client()
+
+    with pytest.raises(ValueError, match="Duplicate property IDs"):
+        client.get_multi_property_report(
+            ["1", "2", "1"], start_date="2025-06-01", end_date="2025-06-07",
+            dimensions=["date"], metrics=["sessions"]
+        )
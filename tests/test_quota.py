@@ -0,0 +1,70 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from ga4_app import QuotaTracker
+
+
+def test_exhausted_daily_quota_raises():
+    tracker = QuotaTracker()
+    tracker.tokens_per_day = 0
+
+    with pytest.raises(RuntimeError, match="Daily token quota exhausted"):
+        tracker.acquire()
+
+
+def test_daily_quota_resets_at_day_boundary():
+    tracker = QuotaTracker()
+    tracker.tokens_per_day = 0
+    tracker._day_started_at = date.today() - timedelta(days=2)
+
+    tracker.acquire()
+
+    assert tracker.tokens_per_day is None
+    tracker.release()
+
+
+def test_acquire_respects_concurrency_limit():
+    tracker = QuotaTracker(max_concurrent_requests=2)
+
+    tracker.acquire()
+    tracker.acquire()
+
+    assert tracker._in_flight == 2
+    tracker.release()
+    tracker.release()
+    assert tracker._in_flight == 0
+
+
+def test_async_acquire_waits_for_a_free_slot():
+    tracker = QuotaTracker(max_concurrent_requests=2)
+
+    async def run():
+        await tracker.acquire_async()
+        await tracker.acquire_async()
+        waiter = asyncio.create_task(tracker.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        tracker.release_async()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert tracker._in_flight == 2
+
+    asyncio.run(run())
+
+
+def test_async_acquire_with_exhausted_daily_quota_keeps_no_slot():
+    tracker = QuotaTracker(max_concurrent_requests=1)
+    tracker.tokens_per_day = 0
+
+    async def run():
+        with pytest.raises(RuntimeError, match="Daily token quota exhausted"):
+            await tracker.acquire_async()
+
+        tracker.tokens_per_day = None
+        await asyncio.wait_for(tracker.acquire_async(), timeout=1)
+        tracker.release_async()
+
+    asyncio.run(run())
+    assert tracker._in_flight == 0
@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("google.api_core")
+
+from google.api_core import exceptions as api_exceptions
+
+from ga4_app import RetryPolicy
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (api_exceptions.ServiceUnavailable("Backend unavailable"), True),
+    (api_exceptions.TooManyRequests("Rate limited"), True),
+    (api_exceptions.ResourceExhausted("Exhausted concurrent requests quota"), True),
+    (api_exceptions.ResourceExhausted("Exhausted property tokens per hour"), True),
+    (api_exceptions.ResourceExhausted("Exhausted property tokens per project per hour"), True),
+    (api_exceptions.ResourceExhausted("Exhausted property tokens per day"), False),
+    (api_exceptions.InvalidArgument("Did you mean sessions?"), False),
+])
+def test_is_retryable(error, retryable):
+    assert RetryPolicy().is_retryable(error) is retryable
+
+
+def test_should_retry_stops_when_the_budget_is_spent():
+    policy = RetryPolicy(retry_budget=1)
+    budget = policy.new_budget()
+    error = api_exceptions.ServiceUnavailable("Backend unavailable")
+
+    assert policy.should_retry(error, 0, budget)
+    assert not policy.should_retry(error, 0, budget)
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+ROW_COUNT = 100
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
+
+
+def test_sharded_report_is_resorted_by_leading_dimension(client):
+    df = client.get_report(
+        "2025-06-01", "2025-06-07", ["deviceCategory", "date"], ["sessions"],
+        convert_date_columns=False, shard_by="day"
+    )
+
+    assert len(df) == 700
+    assert client.last_request_count == 7
+    assert df["deviceCategory"].is_monotonic_increasing
+
+
+def test_sharded_report_keeps_chronological_order_when_ordered_by_date(client):
+    df = client.get_report(
+        "2025-06-01", "2025-06-07", ["date", "deviceCategory"], ["sessions"],
+        convert_date_columns=False, shard_by="day"
+    )
+
+    assert df["date"].is_monotonic_increasing
+
+
+def test_sharding_rejects_checkpoint_dir(client, tmp_path):
+    with pytest.raises(ValueError, match="checkpoint_dir"):
+        client.get_report(
+            "2025-06-01", "2025-06-07", ["date"], ["sessions"],
+            shard_by="day", checkpoint_dir=str(tmp_path)
+        )
@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+pytest.importorskip("pyarrow")
+
+ROW_COUNT = 100
+
+
+@pytest.fixture
+def client(make_client, monkeypatch):
+    client = make_client()
+    client.fetched_ranges = []
+    get_report = client.get_report
+
+    def recording_get_report(**kwargs):
+        client.fetched_ranges.append((kwargs["start_date"], kwargs["end_date"]))
+        return get_report(**kwargs)
+
+    monkeypatch.setattr(client, "get_report", recording_get_report)
+    return client
+
+
+def sync(client, store_dir, start_date, end_date):
+    return client.sync_report(str(store_dir), start_date, end_date, ["date", "deviceCategory"], ["sessions"])
+
+
+def test_sync_fetches_only_missing_days(client, tmp_path):
+    sync(client, tmp_path, "2025-06-01", "2025-06-10")
+    df = sync(client, tmp_path, "2025-06-05", "2025-06-14")
+
+    assert client.fetched_ranges == [("2025-06-01", "2025-06-10"), ("2025-06-11", "2025-06-14")]
+    # Each fetched report has ROW_COUNT rows spread over its days
+    assert len(df) == 6 * 10 + 100
+    assert df["sessions"].dtype == "int64"
+    assert df["date"].min() == df["date"].max() - timedelta(days=9)
+
+
+def test_sync_refetches_days_inside_freshness_window(client, tmp_path):
+    today = date.today()
+    start = (today - timedelta(days=10)).isoformat()
+
+    sync(client, tmp_path, start, "yesterday")
+    sync(client, tmp_path, start, "yesterday")
+
+    freshness_start = (today - timedelta(days=3)).isoformat()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    assert client.fetched_ranges == [(start, yesterday), (freshness_start, yesterday)]
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.analytics.data_v1beta")
+
+from ga4_app import metadata_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_metadata_cache():
+    metadata_cache.clear()
+    yield
+    metadata_cache.clear()
+
+
+def test_unknown_names_fail_before_any_report_request(make_client, server):
+    client = make_client(validate="names")
+
+    with pytest.raises(ValueError, match="Unknown names"):
+        client.get_report("2025-06-01", "2025-06-30", ["date", "devicecategory"], ["sessions"])
+
+    # Only the metadata call reached the server
+    assert server.request_count == 1
+
+
+def test_incompatible_names_fail_before_any_report_request(make_client, server):
+    server.incompatible = {("userGender", "sessions")}
+    client = make_client(validate="compatibility")
+
+    with pytest.raises(ValueError, match="Incompatible names"):
+        client.get_report("2025-06-01", "2025-06-30", ["date", "userGender"], ["sessions"])
+
+    # One metadata and one compatibility call
+    assert server.request_count == 2
+
+
+def test_validation_answers_are_cached(make_client, server):
+    client = make_client(validate="compatibility")
+
+    client.get_report("2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"])
+    requests_after_first_report = server.request_count
+    make_client(validate="compatibility").get_report(
+        "2025-06-01", "2025-06-30", ["date", "deviceCategory"], ["sessions"]
+    )
+
+    # Metadata, compatibility and four pages, then only the four pages again
+    assert requests_after_first_report == 6
+    assert server.request_count - requests_after_first_report == 4